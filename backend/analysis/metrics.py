@@ -3,6 +3,10 @@ import numpy as np
 from scipy import stats
 from sklearn.preprocessing import MinMaxScaler
 
+# Quantiles reported per parameter, each computed in one quantile() call
+_OVERALL_QUANTILES = [0.1, 0.25, 0.75, 0.9, 0.95, 0.99]
+_PERCENTILES = [0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99]
+
 
 def compute_basic_metrics(df):
     """Compute comprehensive basic metrics matching the EDA notebook analysis"""
@@ -31,24 +35,27 @@ def compute_basic_metrics(df):
     # Enhanced statistical analysis
     for col in numeric_cols:
         series = df[col]
+        mean, std = series.mean(), series.std()
+        col_min, col_max = series.min(), series.max()
+        q = series.quantile(_OVERALL_QUANTILES)
         metrics["overall_stats"][col] = {
-            "mean": float(series.mean()),
-            "min": float(series.min()),
-            "max": float(series.max()),
-            "std": float(series.std()),
+            "mean": float(mean),
+            "min": float(col_min),
+            "max": float(col_max),
+            "std": float(std),
             "median": float(series.median()),
-            "q25": float(series.quantile(0.25)),
-            "q75": float(series.quantile(0.75)),
-            "range": float(series.max() - series.min()),
+            "q25": float(q[0.25]),
+            "q75": float(q[0.75]),
+            "range": float(col_max - col_min),
             "variance": float(series.var()),
-            "coefficient_of_variation": float(series.std() / series.mean()) if series.mean() != 0 else 0.0,
+            "coefficient_of_variation": float(std / mean) if mean != 0 else 0.0,
             "skewness": float(series.skew()),
             "kurtosis": float(series.kurtosis()),
             "percentiles": {
-                "p10": float(series.quantile(0.1)),
-                "p90": float(series.quantile(0.9)),
-                "p95": float(series.quantile(0.95)),
-                "p99": float(series.quantile(0.99))
+                "p10": float(q[0.1]),
+                "p90": float(q[0.9]),
+                "p95": float(q[0.95]),
+                "p99": float(q[0.99])
             }
         }
 
@@ -162,15 +169,17 @@ def compute_advanced_statistics(df):
     
     for col in numeric_cols:
         series = df[col]
+        mean, std = series.mean(), series.std()
+        q = series.quantile(_PERCENTILES)
         
         # Variance and dispersion analysis
         advanced_stats["variance_analysis"][col] = {
             "variance": float(series.var()),
-            "standard_deviation": float(series.std()),
-            "coefficient_of_variation": float(series.std() / series.mean()) if series.mean() != 0 else 0.0,
-            "mean_absolute_deviation": float(np.mean(np.abs(series - series.mean()))),
+            "standard_deviation": float(std),
+            "coefficient_of_variation": float(std / mean) if mean != 0 else 0.0,
+            "mean_absolute_deviation": float(np.mean(np.abs(series - mean))),
             "range": float(series.max() - series.min()),
-            "interquartile_range": float(series.quantile(0.75) - series.quantile(0.25))
+            "interquartile_range": float(q[0.75] - q[0.25])
         }
         
         # Distribution characteristics
@@ -198,15 +207,15 @@ def compute_advanced_statistics(df):
         
         # Comprehensive percentile analysis
         advanced_stats["percentile_analysis"][col] = {
-            "p1": float(series.quantile(0.01)),
-            "p5": float(series.quantile(0.05)),
-            "p10": float(series.quantile(0.1)),
-            "p25": float(series.quantile(0.25)),
-            "p50": float(series.quantile(0.5)),
-            "p75": float(series.quantile(0.75)),
-            "p90": float(series.quantile(0.9)),
-            "p95": float(series.quantile(0.95)),
-            "p99": float(series.quantile(0.99))
+            "p1": float(q[0.01]),
+            "p5": float(q[0.05]),
+            "p10": float(q[0.1]),
+            "p25": float(q[0.25]),
+            "p50": float(q[0.5]),
+            "p75": float(q[0.75]),
+            "p90": float(q[0.9]),
+            "p95": float(q[0.95]),
+            "p99": float(q[0.99])
         }
     
     # Correlation analysis
@@ -5,7 +5,7 @@ Replicates the same API calls used by the React frontend
 
 import requests
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, BinaryIO
 from config import API_ENDPOINTS
 
 class APIClient:
@@ -143,6 +143,22 @@ class APIClient:
         else:
             response.raise_for_status()
     
+    def stream_pdf_from_dataset(self, dataset_id: int, fileobj: BinaryIO,
+                                chunk_size: int = 65536) -> None:
+        """Write a stored dataset's PDF report to fileobj as it downloads"""
+        if not self.token:
+            raise Exception("Authentication required")
+            
+        url = API_ENDPOINTS['generate_pdf_dataset'].format(id=dataset_id)
+        with self.session.get(
+            url,
+            headers={'Authorization': f'Token {self.token}'},
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                fileobj.write(chunk)
+    
     def delete_dataset(self, dataset_id: int) -> bool:
         """Delete a dataset"""
         if not self.token:
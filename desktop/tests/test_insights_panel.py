@@ -0,0 +1,34 @@
+"""Tests for the insights panel's update handling"""
+
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from ui.charts.insights_panel import InsightsPanel
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def _type_stats(mean):
+    return {'count': 2, 'efficiency_metrics': {'overall_efficiency': {'mean': mean}}}
+
+
+def test_forced_update_resorts_results_mutated_in_place():
+    results = {'efficiency': {'by_type': {'Pump': _type_stats(0.9),
+                                          'Valve': _type_stats(0.4)}}}
+    panel = InsightsPanel()
+    panel.update_data(results)
+    panel._flush_update()
+    assert [row[0] for row in panel.get_sorted_efficiency_types(results)] == ['Pump', 'Valve']
+    
+    results['efficiency']['by_type']['Valve'] = _type_stats(0.95)
+    panel.update_data(results, force=True)
+    panel._flush_update()
+    
+    sorted_types = panel.get_sorted_efficiency_types(results)
+    assert [row[0] for row in sorted_types] == ['Valve', 'Pump']
+    assert sorted_types[0][2] == 0.95
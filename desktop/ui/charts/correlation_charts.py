@@ -3,8 +3,8 @@ Correlation Charts - Professional card-based layout
 Clean, modern analytics dashboard design
 """
 
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.artist import setp
 from matplotlib.figure import Figure
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QGridLayout, QFrame)
@@ -284,7 +284,7 @@ class CorrelationCharts(QWidget):
         ax.tick_params(colors=COLORS['text_secondary'])
         
         # Rotate x-axis labels for better readability
-        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        setp(ax.get_xticklabels(), rotation=45, ha='right')
         
         # Add value labels on bars
         for bar, value in zip(bars, values):
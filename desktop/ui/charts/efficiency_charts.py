@@ -3,7 +3,6 @@ Efficiency Charts - Professional card-based layout
 Clean, modern analytics dashboard design
 """
 
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
@@ -92,7 +91,8 @@ class EfficiencyCharts(QWidget):
         header_layout.addWidget(desc_label)
         
         # Chart area
-        figure = Figure(figsize=(10, 6), dpi=100)
+        # Constrained layout is solved at draw time; no per-update layout pass
+        figure = Figure(figsize=(10, 6), dpi=100, layout='constrained')
         figure.patch.set_facecolor('white')
         canvas = FigureCanvas(figure)
         canvas.setMinimumSize(DIMENSIONS['chart_min_width'], DIMENSIONS['chart_min_height'])
@@ -144,7 +144,6 @@ class EfficiencyCharts(QWidget):
             ax.set_facecolor(COLORS['surface_variant'])
             
             figure.patch.set_facecolor('white')
-            figure.tight_layout()
             self.efficiency_chart.canvas.draw()
             return
         
@@ -169,24 +168,30 @@ class EfficiencyCharts(QWidget):
         # Add value labels on bars
         for i, (bar, score) in enumerate(zip(bars, scores)):
             width = bar.get_width()
-            ax.text(width + 0.01, bar.get_y() + bar.get_height()/2,
-                   f'{score:.3f}', ha='left', va='center', 
-                   fontsize=10, color=COLORS['text_primary'], fontweight='bold')
+            label = ax.text(width + 0.01, bar.get_y() + bar.get_height()/2,
+                            f'{score:.3f}', ha='left', va='center', 
+                            fontsize=10, color=COLORS['text_primary'], fontweight='bold')
+            # Labels sit inside the axes; skip Agg's per-text clip test
+            label.set_clip_on(False)
         
-        # Professional styling
         ax.set_yticks(y_pos)
         ax.set_yticklabels(names, fontsize=10)
-        ax.set_xlabel('Efficiency Score', fontsize=12, color=COLORS['text_secondary'])
         ax.set_xlim(0, max(scores) * 1.15 if scores else 1)
+        self._style_axes(ax)
+        
+        # Invert y-axis to show highest scores at top
+        ax.invert_yaxis()
+        
+        self.efficiency_chart.canvas.draw()
+        
+    def _style_axes(self, ax):
+        """Apply the static professional styling to the ranking axes"""
+        ax.set_xlabel('Efficiency Score', fontsize=12, color=COLORS['text_secondary'])
         ax.grid(True, alpha=0.3, color=COLORS['border'], axis='x')
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.spines['left'].set_color(COLORS['border'])
         ax.spines['bottom'].set_color(COLORS['border'])
         ax.tick_params(colors=COLORS['text_secondary'])
-        
-        # Invert y-axis to show highest scores at top
-        ax.invert_yaxis()
-        
-        figure.tight_layout()
-        self.efficiency_chart.canvas.draw()
\ No newline at end of file
+        # Artists below zorder 0 (none here) are rasterized; keeps Agg on its fast path
+        ax.set_rasterization_zorder(0)
\ No newline at end of file
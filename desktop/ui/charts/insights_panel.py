@@ -3,14 +3,461 @@ Insights Panel - Professional card-based layout
 Clean, modern analytics dashboard design
 """
 
+import math
+from collections import OrderedDict
+from operator import itemgetter
+
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QFrame, QScrollArea, QGridLayout)
-from PyQt5.QtCore import Qt
-import json
+from PyQt5.QtCore import Qt, QSize, QTimer, QEvent
+from PyQt5.QtGui import (QTextDocument, QPixmap, QPainter, QPalette,
+                         QAbstractTextDocumentLayout)
+import numpy as np
 
 from ..design_system import (COLORS, SPACING, DIMENSIONS, CARD_STYLE, TYPOGRAPHY,
                             get_section_title_style, get_card_title_style, 
-                            get_body_text_style, get_caption_style)
+                            get_body_text_style, get_caption_style, scoped_style)
+
+# Stylesheets shared by every refresh, built once from the design system
+_BODY_QSS = get_body_text_style()
+_CARD_TITLE_QSS = get_card_title_style()
+_SECTION_TITLE_QSS = get_section_title_style()
+
+_TYPE_CARD_QSS = f"""
+QFrame {{
+    background-color: {COLORS['surface_variant']};
+    padding: {SPACING['md']}px;
+    margin-bottom: {SPACING['sm']}px;
+    border-radius: 6px;
+}}
+"""
+
+_TYPE_TITLE_QSS = f"""
+QLabel {{
+    font-weight: bold;
+    color: {COLORS['text_primary']};
+    font-size: 14px;
+}}
+"""
+
+_DETAIL_CARD_QSS = f"""
+QFrame {{
+    background-color: {COLORS['surface_variant']};
+    border: 1px solid {COLORS['border_light']};
+    border-radius: 6px;
+    padding: {SPACING['md']}px;
+    margin-bottom: {SPACING['sm']}px;
+}}
+"""
+
+_CARD_HEADING_QSS = f"""
+QLabel {{
+    font-weight: bold;
+    color: {COLORS['text_primary']};
+    margin-bottom: {SPACING['xs']}px;
+}}
+"""
+
+_EFF_TYPE_TITLE_QSS = f"""
+QLabel {{
+    font-weight: bold;
+    color: {COLORS['text_primary']};
+    font-size: 14px;
+    margin-bottom: {SPACING['xs']}px;
+}}
+"""
+
+_NO_DATA_FRAME_QSS = f"""
+QFrame {{
+    background-color: {COLORS['surface']};
+    border: 2px dashed {COLORS['border']};
+    border-radius: 12px;
+    padding: {SPACING['xxl']}px;
+    margin: {SPACING['lg']}px;
+}}
+"""
+
+_NO_DATA_TITLE_QSS = f"""
+QLabel {{
+    color: {COLORS['text_primary']};
+    font-size: 20px;
+    font-weight: 600;
+    margin: 0;
+}}
+"""
+
+_NO_DATA_DESC_QSS = f"""
+QLabel {{
+    color: {COLORS['text_secondary']};
+    font-size: {TYPOGRAPHY['body']['size']}px;
+    margin: 0;
+    max-width: 400px;
+}}
+"""
+
+# Correlation strength bands: |r| above each threshold moves up one band
+_CORRELATION_THRESHOLDS = np.array([0.2, 0.4, 0.6, 0.8])
+_CORRELATION_STRENGTHS = ("Very Weak", "Weak", "Moderate", "Strong", "Very Strong")
+
+# Implications for flowrate-temperature, flowrate-pressure, pressure-temperature
+_CORRELATION_IMPLICATIONS = (
+    "<p>• Strong flowrate-temperature relationship suggests thermal efficiency considerations</p>",
+    "<p>• Significant flowrate-pressure correlation indicates hydraulic system interdependencies</p>",
+    "<p>• Pressure-temperature correlation suggests thermodynamic relationships</p>",
+)
+
+_SECTION_HEADER_QSS = f"""
+QFrame {{
+    background-color: transparent;
+    padding-bottom: {SPACING['sm']}px;
+    margin-bottom: {SPACING['md']}px;
+}}
+"""
+
+# Color variants selected with the "variant" property: the underline of a
+# section header and the left edge of a type card
+_VARIANTS = ('primary', 'info', 'success', 'warning', 'error')
+
+def _variant_rules(name, declaration):
+    """Color rules for each variant of a container, formatted with its color"""
+    return [f'#insightSection QFrame#{name}[variant="{variant}"], '
+            f'#insightSection #{name}[variant="{variant}"] QFrame '
+            f'{{ {declaration.format(COLORS[variant])} }}'
+            for variant in _VARIANTS]
+
+# One stylesheet for the whole panel; widgets are matched by object name.
+# Container rules also match descendant QFrames (QLabel included) to keep the
+# cascade the per-widget "QFrame { ... }" sheets used to produce. Label rules
+# come last so they win over container rules of equal specificity.
+_PANEL_QSS = "\n".join([
+    scoped_style("QFrame#insightSection, #insightSection QFrame", CARD_STYLE),
+    scoped_style("#insightSection QFrame#sectionHeader, #insightSection #sectionHeader QFrame",
+            _SECTION_HEADER_QSS),
+    *_variant_rules('sectionHeader', "border-bottom: 2px solid {};"),
+    scoped_style("#insightSection QFrame#typeCard, #insightSection #typeCard QFrame", _TYPE_CARD_QSS),
+    *_variant_rules('typeCard', "border-left: 4px solid {};"),
+    scoped_style("#insightSection QFrame#detailCard, #insightSection #detailCard QFrame", _DETAIL_CARD_QSS),
+    scoped_style("QFrame#effTypeCard, #effTypeCard QFrame", CARD_STYLE),
+    scoped_style("QFrame#noData, #noData QFrame", _NO_DATA_FRAME_QSS),
+    scoped_style("#insightSection QLabel#body, #effTypeCard QLabel#body", _BODY_QSS),
+    scoped_style("#insightSection QLabel#cardTitle", _CARD_TITLE_QSS),
+    scoped_style("#insightSection QLabel#typeTitle", _TYPE_TITLE_QSS),
+    scoped_style("#insightSection QLabel#cardHeading", _CARD_HEADING_QSS),
+    scoped_style("#effTypeCard QLabel#effTypeTitle", _EFF_TYPE_TITLE_QSS),
+    "#noData QLabel#noDataIcon { font-size: 48px; margin: 0; }",
+    scoped_style("#noData QLabel#noDataTitle", _NO_DATA_TITLE_QSS),
+    scoped_style("#noData QLabel#noDataDesc", _NO_DATA_DESC_QSS),
+])
+
+# Ranking rows normally carry both fields; itemgetter pulls them in one C call
+_name_score = itemgetter('equipment_name', 'efficiency_score')
+
+def _get_name_score(performer):
+    """Get (equipment_name, efficiency_score) from a ranking row"""
+    try:
+        return _name_score(performer)
+    except KeyError:
+        return performer.get('equipment_name', 'Unknown'), performer.get('efficiency_score', 0)
+
+# QLabel's default alignment, restored on labels taken from the pool
+_LABEL_ALIGNMENT = Qt.AlignLeft | Qt.AlignVCenter
+
+# Pre-bound formatters for the scores and percentages repeated across cards
+_f3 = "{:.3f}".format
+_f1 = "{:.1f}".format
+
+# Row kinds in the insights list; each maps to the InsightsPanel builder that
+# turns a row payload into its card widget
+_ROW_OVERVIEW = 'overview'
+_ROW_TYPE_ANALYSIS = 'type_analysis'
+_ROW_HIGH_PERFORMANCE = 'high_performance'
+_ROW_RECOMMENDATIONS = 'recommendations'
+_ROW_HIGH_TEMPERATURE = 'high_temperature'
+_ROW_PERFORMANCE = 'performance'
+_ROW_CORRELATION = 'correlation'
+_ROW_EFFICIENCY_HEADER = 'efficiency_header'
+_ROW_EFFICIENCY_TYPE = 'efficiency_type'
+_ROW_NO_DATA = 'no_data'
+
+_ROW_BUILDERS = {
+    _ROW_OVERVIEW: 'create_dataset_overview_section',
+    _ROW_TYPE_ANALYSIS: 'create_equipment_type_analysis_section',
+    _ROW_HIGH_PERFORMANCE: 'create_high_performance_section',
+    _ROW_RECOMMENDATIONS: 'create_recommendations_section',
+    _ROW_HIGH_TEMPERATURE: 'create_high_temperature_section',
+    _ROW_PERFORMANCE: 'create_performance_insights_section',
+    _ROW_CORRELATION: 'create_correlation_insights_section',
+    _ROW_EFFICIENCY_HEADER: 'create_efficiency_insights_section',
+    _ROW_EFFICIENCY_TYPE: 'create_efficiency_type_card',
+    _ROW_NO_DATA: 'create_no_data_section',
+}
+
+class _HtmlSnapshotLabel(QLabel):
+    """Label for static rich text that paints from a pre-rendered pixmap
+    
+    A rich-text QLabel lays its HTML out again on every paint. This lays the
+    document out once per width into a pixmap and blits it; after a resize
+    the pixmap is re-rendered once the width settles.
+    """
+    
+    # Debounce for re-rendering after the label is resized
+    RENDER_DELAY_MS = 50
+    
+    def __init__(self):
+        super().__init__()
+        self._html = None
+        self._pixmap = None
+        self._document = QTextDocument(self)
+        # Match QLabel, which lays out rich text without a document margin
+        self._document.setDocumentMargin(0)
+        
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(self.RENDER_DELAY_MS)
+        self._render_timer.timeout.connect(self._render)
+        
+    def html(self):
+        return self._html
+        
+    def set_html(self, html):
+        """Show new HTML; the pixmap is rebuilt on the next paint"""
+        if html == self._html:
+            return
+        self._html = html
+        self._document.setHtml(html)
+        self._invalidate()
+        
+    def _invalidate(self):
+        self._pixmap = None
+        self.updateGeometry()
+        self.update()
+        
+    def _text_rect(self):
+        """Area the text is drawn in, placed the way QLabel places left-aligned text"""
+        rect = self.contentsRect()
+        # A framed QLabel without an explicit indent is indented by half an 'x'
+        indent = self.indent()
+        if indent < 0 and self.frameWidth():
+            indent = self.fontMetrics().horizontalAdvance('x') // 2
+        if indent > 0:
+            rect.setLeft(rect.left() + indent)
+        return rect
+        
+    def _insets(self):
+        """Horizontal and vertical space taken by frame, padding and indent"""
+        rect, text_rect = self.rect(), self._text_rect()
+        return rect.width() - text_rect.width(), rect.height() - text_rect.height()
+        
+    def _layout_document(self, text_width):
+        """Lay the document out at text_width and return its height"""
+        self._document.setDefaultFont(self.font())
+        self._document.setTextWidth(text_width)
+        return math.ceil(self._document.size().height())
+        
+    def hasHeightForWidth(self):
+        return True
+        
+    def heightForWidth(self, width):
+        dx, dy = self._insets()
+        return self._layout_document(max(width - dx, 0)) + dy
+        
+    def sizeHint(self):
+        # Same preferred width QLabel uses for wrapped text: about 80 characters
+        dx, dy = self._insets()
+        self._layout_document(-1)
+        width = min(math.ceil(self._document.idealWidth()),
+                    self.fontMetrics().averageCharWidth() * 80)
+        return QSize(width + dx, self._layout_document(width) + dy)
+        
+    def minimumSizeHint(self):
+        # Narrowest width is the longest word; shortest height is unwrapped
+        dx, dy = self._insets()
+        self._layout_document(0)
+        width = math.ceil(self._document.idealWidth())
+        return QSize(width + dx, self._layout_document(-1) + dy)
+        
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() in (QEvent.FontChange, QEvent.PaletteChange, QEvent.StyleChange):
+            self._invalidate()
+            
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._pixmap is not None and event.size().width() != event.oldSize().width():
+            self._render_timer.start()
+            
+    def paintEvent(self, event):
+        # The label has no text of its own, so QLabel only draws the frame
+        super().paintEvent(event)
+        if self._pixmap is None:
+            self._render()
+        # Vertically centered, as QLabel's default alignment does
+        text_rect = self._text_rect()
+        spare = text_rect.height() - round(self._pixmap.height() / self._pixmap.devicePixelRatio())
+        painter = QPainter(self)
+        painter.drawPixmap(text_rect.left(), text_rect.top() + max(spare, 0) // 2, self._pixmap)
+        
+    def _render(self):
+        """Render the document at the current width into the cached pixmap"""
+        width = max(self._text_rect().width(), 1)
+        height = max(self._layout_document(width), 1)
+        ratio = self.devicePixelRatioF()
+        
+        pixmap = QPixmap(math.ceil(width * ratio), math.ceil(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        context = QAbstractTextDocumentLayout.PaintContext()
+        context.palette.setColor(QPalette.Text, self.palette().color(self.foregroundRole()))
+        painter = QPainter(pixmap)
+        self._document.documentLayout().draw(painter, context)
+        painter.end()
+        
+        self._pixmap = pixmap
+        self.update()
+
+class _LazySectionHost(QWidget):
+    """Scroll-area content widget that only builds rows near the viewport
+    
+    Rows are ``(kind, payload, estimated_height)`` tuples turned into widgets by
+    the ``build(kind, payload)`` callback. Until a row scrolls into view its
+    estimated height is reserved so the scrollbar range stays correct; once
+    built, the measured height replaces it.
+    """
+    
+    # Built sections kept alive after scrolling out of view
+    CACHE_LIMIT = 20
+    
+    def __init__(self, scroll_area, spacing, margin, build, release):
+        super().__init__()
+        self._scroll_area = scroll_area
+        self._build = build
+        self._release = release
+        self._spacing = spacing
+        self._margin = margin
+        self._pending_sections = []
+        self._offsets = []
+        self._built = OrderedDict()
+        self._total_height = 0
+        self._batching = False
+        scroll_area.verticalScrollBar().valueChanged.connect(self._on_scroll)
+        
+    def set_sections(self, sections):
+        """Replace all sections with new ``(kind, payload, height)`` rows"""
+        # Tear down and rebuild as one batch so Qt runs a single layout pass
+        scroll_bar = self._scroll_area.verticalScrollBar()
+        self._batching = True
+        self.setUpdatesEnabled(False)
+        scroll_bar.blockSignals(True)
+        try:
+            self._release_built()
+            self._pending_sections = [list(section) for section in sections]
+            self._relayout()
+            self._materialize_visible()
+        finally:
+            scroll_bar.blockSignals(False)
+            self._batching = False
+            self.setUpdatesEnabled(True)
+        self.updateGeometry()
+        
+    def clear(self):
+        """Drop every queued and built section"""
+        self.set_sections([])
+        
+    def _release_built(self):
+        """Hand every built section back to the owner for reuse"""
+        for widget in self._built.values():
+            self._release(widget)
+        self._built.clear()
+        
+    def sizeHint(self):
+        return QSize(self.width(), self._total_height)
+        
+    def minimumSizeHint(self):
+        return QSize(0, self._total_height)
+        
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._materialize_visible()
+        
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if event.size().width() != event.oldSize().width():
+            self._relayout()
+        self._materialize_visible()
+        
+    def _on_scroll(self, _value):
+        self._materialize_visible()
+        
+    def _measure(self, widget, width):
+        """Height a built section needs at the given width"""
+        if widget.hasHeightForWidth():
+            height = widget.heightForWidth(width)
+        else:
+            height = widget.sizeHint().height()
+        return max(height, widget.minimumSizeHint().height())
+        
+    def _relayout(self):
+        """Recompute section offsets and position the built sections"""
+        margin = self._margin
+        width = self.width() - 2 * margin
+        y = margin
+        self._offsets = []
+        for index, entry in enumerate(self._pending_sections):
+            widget = self._built.get(index)
+            if widget is not None:
+                entry[2] = self._measure(widget, width)
+                widget.setGeometry(margin, y, width, entry[2])
+            self._offsets.append(y)
+            y += entry[2] + self._spacing
+        
+        total_height = y - self._spacing + margin if self._offsets else 0
+        if total_height != self._total_height:
+            self._total_height = total_height
+            if not self._batching:
+                self.updateGeometry()
+            
+    def _materialize_visible(self):
+        """Build sections intersecting the viewport, evicting stale ones"""
+        if not self.isVisible() or not self._pending_sections:
+            return
+        
+        # Built sections may come out shorter than estimated and expose more
+        while True:
+            top = self._scroll_area.verticalScrollBar().value()
+            bottom = top + self._scroll_area.viewport().height()
+            visible = []
+            built_any = False
+            for index, entry in enumerate(self._pending_sections):
+                y = self._offsets[index]
+                if y > bottom:
+                    break
+                if y + entry[2] < top:
+                    continue
+                visible.append(index)
+                if index in self._built:
+                    self._built.move_to_end(index)
+                    continue
+                kind, payload, _ = entry
+                widget = self._build(kind, payload)
+                widget.setParent(self)
+                widget.ensurePolished()
+                widget.show()
+                self._built[index] = widget
+                built_any = True
+            
+            if not built_any:
+                break
+            self._evict(visible)
+            self._relayout()
+            
+    def _evict(self, visible):
+        """Release least recently shown sections beyond the cache limit"""
+        for index in list(self._built):
+            if len(self._built) <= self.CACHE_LIMIT:
+                break
+            if index not in visible:
+                self._release(self._built.pop(index))
 
 class InsightsPanel(QWidget):
     """Professional insights panel with card-based layout"""
@@ -18,10 +465,26 @@ class InsightsPanel(QWidget):
     def __init__(self):
         super().__init__()
         self.analysis_data = None
+        # Identity fingerprint of the last analysis_results rendered
+        self._last_data_key = None
+        # (analysis_results, sorted per-type efficiency rows) from the last sort
+        self._sorted_by_type_cache = (None, [])
+        # Released labels and frames, reused by the next refresh
+        self._label_pool = []
+        self._html_label_pool = []
+        self._frame_pool = []
+        # Latest (analysis_results, force) waiting for the coalesced rebuild
+        self._pending_update = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._flush_update)
         self.init_ui()
         
     def init_ui(self):
         """Initialize insights UI with professional layout"""
+        self.setStyleSheet(_PANEL_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(SPACING['lg'], SPACING['lg'], SPACING['lg'], SPACING['lg'])
         layout.setSpacing(SPACING['lg'])
@@ -53,11 +516,11 @@ class InsightsPanel(QWidget):
         
         # Title
         title_label = QLabel("Key Insights & Recommendations")
-        title_label.setStyleSheet(get_section_title_style())
+        title_label.setStyleSheet(_SECTION_TITLE_QSS)
         
         # Description
         desc_label = QLabel("Comprehensive analysis findings and actionable recommendations")
-        desc_label.setStyleSheet(get_body_text_style())
+        desc_label.setStyleSheet(_BODY_QSS)
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(desc_label)
@@ -88,22 +551,41 @@ class InsightsPanel(QWidget):
             }}
         """)
         
-        self.insights_widget = QWidget()
-        self.insights_layout = QVBoxLayout(self.insights_widget)
-        self.insights_layout.setSpacing(SPACING['lg'])
+        self.insights_widget = _LazySectionHost(scroll_area, SPACING['lg'], SPACING['sm'],
+                                                self._build_row, self._release_widget)
         
         scroll_area.setWidget(self.insights_widget)
         layout.addWidget(scroll_area)
         
-    def update_data(self, analysis_results):
-        """Update insights panel with new analysis data"""
-        self.analysis_data = analysis_results
+    def update_data(self, analysis_results, force=False):
+        """Update insights panel with new analysis data
         
-        # Clear existing widgets
-        for i in reversed(range(self.insights_layout.count())): 
-            child = self.insights_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
+        The rebuild runs on the next event-loop pass, so a burst of calls only
+        renders the last results. Re-sending the same, unmodified results is a
+        no-op; pass force=True after mutating them in place.
+        """
+        if self._pending_update is not None:
+            force = force or self._pending_update[1]
+        self._pending_update = (analysis_results, force)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+            
+    def _flush_update(self):
+        """Rebuild from the most recent results passed to update_data"""
+        if self._pending_update is None:
+            return
+        analysis_results, force = self._pending_update
+        self._pending_update = None
+        
+        data_key = self._data_key(analysis_results)
+        if not force and data_key == self._last_data_key:
+            return
+        self._last_data_key = data_key
+        self.analysis_data = analysis_results
+        if force:
+            # Results may have been changed in place, which the identity-keyed
+            # sort cache can't tell
+            self._sorted_by_type_cache = (None, [])
         
         # Get insights data
         insights = analysis_results.get('comprehensive_insights', {})
@@ -111,102 +593,116 @@ class InsightsPanel(QWidget):
         
         if not insights and not high_temp_analysis:
             self.show_no_data_message()
+            self._last_data_key = data_key
             return
         
-        # Create insight sections
+        # Sections are only built once scrolled into view
+        self.insights_widget.set_sections(self.build_rows(analysis_results))
+        
+    def build_rows(self, analysis_results):
+        """Get the (kind, payload, estimated height) rows describing the insights"""
+        insights = analysis_results.get('comprehensive_insights', {})
+        high_temp_analysis = analysis_results.get('high_temperature_analysis', {})
+        
+        rows = []
         if insights.get('dataset_overview'):
-            self.create_dataset_overview_section(insights['dataset_overview'])
+            rows.append((_ROW_OVERVIEW, (insights['dataset_overview'],), 220))
             
-        if insights.get('equipment_type_analysis'):
-            self.create_equipment_type_analysis_section(insights['equipment_type_analysis'])
+        # Sections whose inputs would produce no cards are left out entirely
+        valid_types = [(equipment_type, analysis) for equipment_type, analysis
+                       in insights.get('equipment_type_analysis', {}).items()
+                       if isinstance(analysis, dict)]
+        if valid_types:
+            rows.append((_ROW_TYPE_ANALYSIS, (valid_types,), 120 + 90 * len(valid_types)))
             
         if insights.get('high_performance_equipment'):
-            self.create_high_performance_section(insights['high_performance_equipment'])
+            rows.append((_ROW_HIGH_PERFORMANCE, (insights['high_performance_equipment'],), 220))
             
         if insights.get('recommendations'):
-            self.create_recommendations_section(insights['recommendations'])
+            recommendations = insights['recommendations']
+            rows.append((_ROW_RECOMMENDATIONS, (recommendations,), 120 + 80 * len(recommendations)))
             
         if high_temp_analysis:
-            self.create_high_temperature_section(high_temp_analysis)
+            rows.append((_ROW_HIGH_TEMPERATURE, (high_temp_analysis,), 260))
             
         # Add performance insights
-        self.create_performance_insights_section(analysis_results)
+        efficiency = analysis_results.get('efficiency', {})
+        rankings = efficiency.get('rankings', {}).get('overall_efficiency', [])
+        if rankings:
+            rows.append((_ROW_PERFORMANCE, (rankings,), 320))
         
         # Add correlation insights
-        self.create_correlation_insights_section(analysis_results)
+        key_correlations = analysis_results.get('correlations', {}).get('key_correlations', {})
+        if key_correlations:
+            rows.append((_ROW_CORRELATION, (key_correlations,), 340))
+        
+        # Add efficiency insights, one row per equipment type
+        sorted_types = self.get_sorted_efficiency_types(analysis_results)
+        if sorted_types:
+            rows.append((_ROW_EFFICIENCY_HEADER, (), 120))
+            for type_row in sorted_types:
+                rows.append((_ROW_EFFICIENCY_TYPE, type_row, 200))
+            
+        return rows
         
-        # Add efficiency insights
-        self.create_efficiency_insights_section(analysis_results)
+    def _build_row(self, kind, payload):
+        """Create the widget for one insights row"""
+        return getattr(self, _ROW_BUILDERS[kind])(*payload)
         
-        # Add stretch to push content to top
-        self.insights_layout.addStretch()
+    def _data_key(self, analysis_results):
+        """Cheap identity fingerprint of analysis_results and its top-level values"""
+        # analysis_data keeps the dict (and so its values) alive, so ids can't be reused
+        return (id(analysis_results),
+                tuple((key, id(value)) for key, value in analysis_results.items()))
         
     def create_dataset_overview_section(self, dataset_overview):
         """Create dataset overview insight section"""
-        section = self.create_insight_section("Dataset Overview", COLORS['primary'])
+        section = self.create_insight_section("Dataset Overview", 'primary')
         
         total_equipment = dataset_overview.get('total_equipment', 0)
         equipment_types = dataset_overview.get('equipment_types', 0)
         
-        overview_text = f"""
-        <p><strong>Total Equipment:</strong> {total_equipment} units analyzed</p>
-        <p><strong>Equipment Types:</strong> {equipment_types} different types identified</p>
-        <p>This dataset provides a comprehensive view of chemical equipment performance 
-        across multiple parameters including flowrate, pressure, and temperature.</p>
-        """
+        overview_text = "\n".join([
+            f"<p><strong>Total Equipment:</strong> {total_equipment} units analyzed</p>",
+            f"<p><strong>Equipment Types:</strong> {equipment_types} different types identified</p>",
+            "<p>This dataset provides a comprehensive view of chemical equipment performance "
+            "across multiple parameters including flowrate, pressure, and temperature.</p>",
+        ])
         
-        content_label = QLabel(overview_text)
-        content_label.setWordWrap(True)
-        content_label.setStyleSheet(get_body_text_style())
+        content_label = self._acquire_html_label(overview_text, 'body')
         section.layout().addWidget(content_label)
         
-        self.insights_layout.addWidget(section)
+        return section
         
     def create_equipment_type_analysis_section(self, type_analysis):
-        """Create equipment type analysis section"""
-        section = self.create_insight_section("Equipment Type Analysis", COLORS['info'])
-        
-        for equipment_type, analysis in type_analysis.items():
-            if isinstance(analysis, dict):
-                count = analysis.get('count', 0)
-                performance_summary = analysis.get('performance_summary', 'No summary available')
-                
-                type_card = QFrame()
-                type_card.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: {COLORS['surface_variant']};
-                        border-left: 4px solid {COLORS['info']};
-                        padding: {SPACING['md']}px;
-                        margin-bottom: {SPACING['sm']}px;
-                        border-radius: 6px;
-                    }}
-                """)
-                
-                type_layout = QVBoxLayout(type_card)
-                type_layout.setSpacing(SPACING['xs'])
-                
-                type_title = QLabel(f"{equipment_type} ({count} units)")
-                type_title.setStyleSheet(f"""
-                    QLabel {{
-                        font-weight: bold;
-                        color: {COLORS['text_primary']};
-                        font-size: 14px;
-                    }}
-                """)
-                type_layout.addWidget(type_title)
-                
-                summary_label = QLabel(performance_summary)
-                summary_label.setWordWrap(True)
-                summary_label.setStyleSheet(get_body_text_style())
-                type_layout.addWidget(summary_label)
-                
-                section.layout().addWidget(type_card)
+        """Create equipment type analysis section from (type, analysis dict) pairs"""
+        section = self.create_insight_section("Equipment Type Analysis", 'info')
+        # Looked up once rather than per card
+        section_layout = section.layout()
+        card_spacing = SPACING['xs']
+        acquire_frame = self._acquire_frame
+        acquire_label = self._acquire_label
+        
+        for equipment_type, analysis in type_analysis:
+            count = analysis.get('count', 0)
+            performance_summary = analysis.get('performance_summary', 'No summary available')
+            
+            type_card = acquire_frame('typeCard', spacing=card_spacing, variant='info')
+            type_layout = type_card.layout()
+            
+            type_title = acquire_label(f"{equipment_type} ({count} units)", 'typeTitle')
+            type_layout.addWidget(type_title)
+            
+            summary_label = acquire_label(performance_summary, 'body', word_wrap=True)
+            type_layout.addWidget(summary_label)
+            
+            section_layout.addWidget(type_card)
         
-        self.insights_layout.addWidget(section)
+        return section
         
     def create_high_performance_section(self, high_performance):
         """Create high performance equipment section"""
-        section = self.create_insight_section("High-Performance Equipment", COLORS['success'])
+        section = self.create_insight_section("High-Performance Equipment", 'success')
         
         best_performer = high_performance.get('best_performer', {})
         if best_performer:
@@ -214,51 +710,39 @@ class InsightsPanel(QWidget):
             equipment_type = best_performer.get('type', 'Unknown')
             efficiency_score = best_performer.get('efficiency_score', 0)
             
-            performance_text = f"""
-            <p><strong>Best Performer:</strong> {equipment_name} ({equipment_type})</p>
-            <p><strong>Efficiency Score:</strong> {efficiency_score:.3f}</p>
-            <p>This equipment demonstrates optimal performance across all measured parameters 
-            and serves as a benchmark for similar equipment types.</p>
-            """
+            performance_text = "\n".join([
+                f"<p><strong>Best Performer:</strong> {equipment_name} ({equipment_type})</p>",
+                f"<p><strong>Efficiency Score:</strong> {_f3(efficiency_score)}</p>",
+                "<p>This equipment demonstrates optimal performance across all measured parameters "
+                "and serves as a benchmark for similar equipment types.</p>",
+            ])
             
-            content_label = QLabel(performance_text)
-            content_label.setWordWrap(True)
-            content_label.setStyleSheet(get_body_text_style())
+            content_label = self._acquire_html_label(performance_text, 'body')
             section.layout().addWidget(content_label)
         
-        self.insights_layout.addWidget(section)
+        return section
         
     def create_recommendations_section(self, recommendations):
         """Create recommendations section"""
-        section = self.create_insight_section("Recommendations", COLORS['warning'])
+        section = self.create_insight_section("Recommendations", 'warning')
         
         if isinstance(recommendations, list):
+            section_layout = section.layout()
+            acquire_frame = self._acquire_frame
+            acquire_label = self._acquire_label
             for i, recommendation in enumerate(recommendations, 1):
-                rec_card = QFrame()
-                rec_card.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: {COLORS['surface_variant']};
-                        border: 1px solid {COLORS['border_light']};
-                        border-radius: 6px;
-                        padding: {SPACING['md']}px;
-                        margin-bottom: {SPACING['sm']}px;
-                    }}
-                """)
+                rec_card = acquire_frame('detailCard')
                 
-                rec_layout = QVBoxLayout(rec_card)
+                rec_label = acquire_label(f"{i}. {recommendation}", 'body', word_wrap=True)
+                rec_card.layout().addWidget(rec_label)
                 
-                rec_label = QLabel(f"{i}. {recommendation}")
-                rec_label.setWordWrap(True)
-                rec_label.setStyleSheet(get_body_text_style())
-                rec_layout.addWidget(rec_label)
-                
-                section.layout().addWidget(rec_card)
+                section_layout.addWidget(rec_card)
         
-        self.insights_layout.addWidget(section)
+        return section
         
     def create_high_temperature_section(self, high_temp_analysis):
         """Create high temperature analysis section"""
-        section = self.create_insight_section("High Temperature Analysis", COLORS['error'])
+        section = self.create_insight_section("High Temperature Analysis", 'error')
         
         threshold = high_temp_analysis.get('threshold', 0)
         count = high_temp_analysis.get('count', 0)
@@ -268,302 +752,244 @@ class InsightsPanel(QWidget):
         min_temp = temp_stats.get('min', 0)
         max_temp = temp_stats.get('max', 0)
         
-        temp_text = f"""
-        <p><strong>High Temperature Equipment:</strong> {count} units operating above {threshold}°</p>
-        <p><strong>Percentage:</strong> {percentage:.1f}% of total equipment</p>
-        <p><strong>Temperature Range:</strong> {min_temp:.1f}° - {max_temp:.1f}°</p>
-        <p>Equipment operating at high temperatures may require additional monitoring 
-        and maintenance to ensure optimal performance and safety.</p>
-        """
+        temp_text = "\n".join([
+            f"<p><strong>High Temperature Equipment:</strong> {count} units operating above {threshold}°</p>",
+            f"<p><strong>Percentage:</strong> {_f1(percentage)}% of total equipment</p>",
+            f"<p><strong>Temperature Range:</strong> {_f1(min_temp)}° - {_f1(max_temp)}°</p>",
+            "<p>Equipment operating at high temperatures may require additional monitoring "
+            "and maintenance to ensure optimal performance and safety.</p>",
+        ])
         
-        content_label = QLabel(temp_text)
-        content_label.setWordWrap(True)
-        content_label.setStyleSheet(get_body_text_style())
+        content_label = self._acquire_html_label(temp_text, 'body')
         section.layout().addWidget(content_label)
         
-        self.insights_layout.addWidget(section)
+        return section
         
-    def create_performance_insights_section(self, analysis_results):
-        """Create performance insights section"""
-        section = self.create_insight_section("Performance Insights", COLORS['primary'])
+    def create_performance_insights_section(self, rankings):
+        """Create performance insights section from overall efficiency rankings"""
+        section = self.create_insight_section("Performance Insights", 'primary')
         
-        # Get efficiency data
-        efficiency = analysis_results.get('efficiency', {})
-        rankings = efficiency.get('rankings', {}).get('overall_efficiency', [])
+        top_performers = rankings[:3]
+        bottom_performers = rankings[-3:]
         
-        if rankings:
-            top_performers = rankings[:3]
-            bottom_performers = rankings[-3:]
-            
-            # Top performers card
-            top_card = QFrame()
-            top_card.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {COLORS['surface_variant']};
-                    border: 1px solid {COLORS['border_light']};
-                    border-radius: 6px;
-                    padding: {SPACING['md']}px;
-                    margin-bottom: {SPACING['sm']}px;
-                }}
-            """)
-            
-            top_layout = QVBoxLayout(top_card)
-            
-            top_title = QLabel("Top Performers:")
-            top_title.setStyleSheet(f"""
-                QLabel {{
-                    font-weight: bold;
-                    color: {COLORS['text_primary']};
-                    margin-bottom: {SPACING['xs']}px;
-                }}
-            """)
-            top_layout.addWidget(top_title)
-            
-            for i, performer in enumerate(top_performers, 1):
-                name = performer.get('equipment_name', 'Unknown')
-                score = performer.get('efficiency_score', 0)
-                perf_label = QLabel(f"{i}. {name}: {score:.3f}")
-                perf_label.setStyleSheet(get_body_text_style())
-                top_layout.addWidget(perf_label)
-            
-            section.layout().addWidget(top_card)
+        # Top performers card
+        top_card = self._acquire_frame('detailCard')
+        top_layout = top_card.layout()
+        
+        top_title = self._acquire_label("Top Performers:", 'cardHeading')
+        top_layout.addWidget(top_title)
+        
+        # One multi-line label instead of a widget per performer
+        performer_lines = "\n".join(f"{i}. {name}: {_f3(score)}" for i, (name, score)
+                                    in enumerate(map(_get_name_score, top_performers), 1))
+        perf_label = self._acquire_label(performer_lines, 'body')
+        top_layout.addWidget(perf_label)
+        
+        section.layout().addWidget(top_card)
+        
+        # Improvement opportunities
+        if bottom_performers:
+            parts = ["<p><strong>Areas for Improvement:</strong></p>",
+                     f"<p>The bottom {len(bottom_performers)} performers show efficiency scores below ",
+                     _f3(bottom_performers[0].get('efficiency_score', 0)),
+                     ", indicating potential for optimization through maintenance "
+                     "or operational adjustments.</p>"]
             
-            # Improvement opportunities
-            if bottom_performers:
-                improvement_text = f"""
-                <p><strong>Areas for Improvement:</strong></p>
-                <p>The bottom {len(bottom_performers)} performers show efficiency scores below 
-                {bottom_performers[0].get('efficiency_score', 0):.3f}, indicating potential 
-                for optimization through maintenance or operational adjustments.</p>
-                """
-                
-                improvement_label = QLabel(improvement_text)
-                improvement_label.setWordWrap(True)
-                improvement_label.setStyleSheet(get_body_text_style())
-                section.layout().addWidget(improvement_label)
+            improvement_label = self._acquire_label("".join(parts), 'body', word_wrap=True)
+            section.layout().addWidget(improvement_label)
         
-        self.insights_layout.addWidget(section)
+        return section
         
-    def create_correlation_insights_section(self, analysis_results):
+    def create_correlation_insights_section(self, key_correlations):
         """Create correlation insights section"""
-        section = self.create_insight_section("Parameter Correlations", COLORS['info'])
+        section = self.create_insight_section("Parameter Correlations", 'info')
         
-        correlations = analysis_results.get('correlations', {})
-        key_correlations = correlations.get('key_correlations', {})
+        flowrate_temp = key_correlations.get('flowrate_temperature', 0)
+        flowrate_pressure = key_correlations.get('flowrate_pressure', 0)
+        pressure_temp = key_correlations.get('pressure_temperature', 0)
         
-        if key_correlations:
-            flowrate_temp = key_correlations.get('flowrate_temperature', 0)
-            flowrate_pressure = key_correlations.get('flowrate_pressure', 0)
-            pressure_temp = key_correlations.get('pressure_temperature', 0)
-            
-            # Correlations grid
-            corr_frame = QFrame()
-            corr_frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {COLORS['surface_variant']};
-                    border: 1px solid {COLORS['border_light']};
-                    border-radius: 6px;
-                    padding: {SPACING['md']}px;
-                    margin-bottom: {SPACING['sm']}px;
-                }}
-            """)
-            
-            corr_layout = QVBoxLayout(corr_frame)
-            
-            corr_title = QLabel("Key Correlations Identified:")
-            corr_title.setStyleSheet(f"""
-                QLabel {{
-                    font-weight: bold;
-                    color: {COLORS['text_primary']};
-                    margin-bottom: {SPACING['xs']}px;
-                }}
-            """)
-            corr_layout.addWidget(corr_title)
-            
-            correlations_text = f"""
-            <p>• Flowrate-Temperature: {flowrate_temp:.3f} ({self.interpret_correlation(flowrate_temp)})</p>
-            <p>• Flowrate-Pressure: {flowrate_pressure:.3f} ({self.interpret_correlation(flowrate_pressure)})</p>
-            <p>• Pressure-Temperature: {pressure_temp:.3f} ({self.interpret_correlation(pressure_temp)})</p>
-            """
-            
-            corr_label = QLabel(correlations_text)
-            corr_label.setWordWrap(True)
-            corr_label.setStyleSheet(get_body_text_style())
-            corr_layout.addWidget(corr_label)
-            
-            section.layout().addWidget(corr_frame)
-            
-            # Operational implications
-            implications_text = "<p><strong>Operational Implications:</strong></p>"
-            
-            if abs(flowrate_temp) > 0.5:
-                implications_text += "<p>• Strong flowrate-temperature relationship suggests thermal efficiency considerations</p>"
-            if abs(flowrate_pressure) > 0.5:
-                implications_text += "<p>• Significant flowrate-pressure correlation indicates hydraulic system interdependencies</p>"
-            if abs(pressure_temp) > 0.5:
-                implications_text += "<p>• Pressure-temperature correlation suggests thermodynamic relationships</p>"
-            
-            if len(implications_text) > len("<p><strong>Operational Implications:</strong></p>"):
-                implications_label = QLabel(implications_text)
-                implications_label.setWordWrap(True)
-                implications_label.setStyleSheet(get_body_text_style())
-                section.layout().addWidget(implications_label)
+        # Correlations grid
+        corr_frame = self._acquire_frame('detailCard')
+        corr_layout = corr_frame.layout()
+        
+        corr_title = self._acquire_label("Key Correlations Identified:", 'cardHeading')
+        corr_layout.addWidget(corr_title)
+        
+        parts = [f"<p>• Flowrate-Temperature: {_f3(flowrate_temp)} ({self.interpret_correlation(flowrate_temp)})</p>",
+                 f"<p>• Flowrate-Pressure: {_f3(flowrate_pressure)} ({self.interpret_correlation(flowrate_pressure)})</p>",
+                 f"<p>• Pressure-Temperature: {_f3(pressure_temp)} ({self.interpret_correlation(pressure_temp)})</p>"]
         
-        self.insights_layout.addWidget(section)
+        corr_label = self._acquire_html_label("".join(parts), 'body')
+        corr_layout.addWidget(corr_label)
         
-    def create_efficiency_insights_section(self, analysis_results):
-        """Create efficiency insights section"""
-        section = self.create_insight_section("Efficiency Analysis", COLORS['success'])
+        section.layout().addWidget(corr_frame)
+        
+        # Operational implications
+        strong = np.abs([flowrate_temp, flowrate_pressure, pressure_temp]) > 0.5
+        
+        if strong.any():
+            parts = ["<p><strong>Operational Implications:</strong></p>"]
+            parts.extend(text for text, is_strong in zip(_CORRELATION_IMPLICATIONS, strong) if is_strong)
+            implications_label = self._acquire_html_label("".join(parts), 'body')
+            section.layout().addWidget(implications_label)
+        
+        return section
+        
+    def create_efficiency_insights_section(self):
+        """Create efficiency insights section header"""
+        return self.create_insight_section("Efficiency Analysis", 'success')
+        
+    def get_sorted_efficiency_types(self, analysis_results):
+        """Get (type, stats, mean efficiency) rows sorted by mean efficiency"""
+        cached_results, sorted_types = self._sorted_by_type_cache
+        if cached_results is analysis_results:
+            return sorted_types
         
         efficiency = analysis_results.get('efficiency', {})
         by_type = efficiency.get('by_type', {})
         
-        if by_type:
-            # Sort types by mean efficiency
-            sorted_types = sorted(by_type.items(), 
-                                key=lambda x: x[1].get('efficiency_metrics', {}).get('overall_efficiency', {}).get('mean', 0), 
-                                reverse=True)
-            
-            for equipment_type, stats in sorted_types:
-                count = stats.get('count', 0)
-                mean_eff = stats.get('efficiency_metrics', {}).get('overall_efficiency', {}).get('mean', 0)
-                top_performer = stats.get('top_performer', {})
-                
-                type_card = QFrame()
-                type_card.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: {COLORS['surface_variant']};
-                        border: 1px solid {COLORS['border_light']};
-                        border-radius: 6px;
-                        padding: {SPACING['md']}px;
-                        margin-bottom: {SPACING['sm']}px;
-                    }}
-                """)
-                
-                type_layout = QVBoxLayout(type_card)
-                
-                type_title = QLabel(f"{equipment_type} ({count} units)")
-                type_title.setStyleSheet(f"""
-                    QLabel {{
-                        font-weight: bold;
-                        color: {COLORS['text_primary']};
-                        font-size: 14px;
-                        margin-bottom: {SPACING['xs']}px;
-                    }}
-                """)
-                type_layout.addWidget(type_title)
-                
-                eff_text = f"Average efficiency: {mean_eff:.3f}"
-                if top_performer:
-                    top_name = top_performer.get('equipment_name', 'Unknown')
-                    top_score = top_performer.get('efficiency_score', 0)
-                    eff_text += f"<br>Best performer: {top_name} ({top_score:.3f})"
-                
-                eff_label = QLabel(eff_text)
-                eff_label.setWordWrap(True)
-                eff_label.setStyleSheet(get_body_text_style())
-                type_layout.addWidget(eff_label)
-                
-                section.layout().addWidget(type_card)
+        sorted_types = [(equipment_type, stats,
+                         stats.get('efficiency_metrics', {}).get('overall_efficiency', {}).get('mean', 0))
+                        for equipment_type, stats in by_type.items()]
+        sorted_types.sort(key=itemgetter(2), reverse=True)
         
-        self.insights_layout.addWidget(section)
+        self._sorted_by_type_cache = (analysis_results, sorted_types)
+        return sorted_types
         
-    def create_insight_section(self, title, accent_color):
-        """Create a professional insight section"""
-        section = QFrame()
-        section.setStyleSheet(CARD_STYLE)
+    def create_efficiency_type_card(self, equipment_type, stats, mean_eff):
+        """Create a per-type efficiency card"""
+        count = stats.get('count', 0)
+        top_performer = stats.get('top_performer', {})
         
-        layout = QVBoxLayout(section)
-        layout.setSpacing(SPACING['md'])
+        # Cards are standalone so they can be built independently on scroll
+        type_card = self._acquire_frame('effTypeCard')
+        type_layout = type_card.layout()
         
-        # Section header with accent color
-        header_frame = QFrame()
-        header_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: transparent;
-                border-bottom: 2px solid {accent_color};
-                padding-bottom: {SPACING['sm']}px;
-                margin-bottom: {SPACING['md']}px;
-            }}
-        """)
+        type_title = self._acquire_label(f"{equipment_type} ({count} units)", 'effTypeTitle')
+        type_layout.addWidget(type_title)
         
-        header_layout = QVBoxLayout(header_frame)
-        header_layout.setContentsMargins(0, 0, 0, 0)
+        eff_text = f"Average efficiency: {_f3(mean_eff)}"
+        if top_performer:
+            top_name, top_score = _get_name_score(top_performer)
+            eff_text += f"<br>Best performer: {top_name} ({_f3(top_score)})"
         
-        title_label = QLabel(title)
-        title_label.setStyleSheet(get_card_title_style())
-        header_layout.addWidget(title_label)
+        eff_label = self._acquire_label(eff_text, 'body', word_wrap=True)
+        type_layout.addWidget(eff_label)
         
-        layout.addWidget(header_frame)
+        return type_card
+        
+    def create_insight_section(self, title, variant):
+        """Create a professional insight section underlined in a variant color"""
+        section = self._acquire_frame('insightSection', spacing=SPACING['md'])
+        
+        # Section header with variant color
+        header_frame = self._acquire_frame('sectionHeader', margins=(0, 0, 0, 0), variant=variant)
+        
+        title_label = self._acquire_label(title, 'cardTitle')
+        header_frame.layout().addWidget(title_label)
+        
+        section.layout().addWidget(header_frame)
         
         return section
         
     def interpret_correlation(self, correlation):
         """Interpret correlation strength"""
-        abs_corr = abs(correlation)
-        if abs_corr > 0.8:
-            strength = "Very Strong"
-        elif abs_corr > 0.6:
-            strength = "Strong"
-        elif abs_corr > 0.4:
-            strength = "Moderate"
-        elif abs_corr > 0.2:
-            strength = "Weak"
-        else:
-            strength = "Very Weak"
-            
+        strength = _CORRELATION_STRENGTHS[np.searchsorted(_CORRELATION_THRESHOLDS, abs(correlation))]
         direction = "Positive" if correlation > 0 else "Negative"
         return f"{strength} {direction}"
         
     def show_no_data_message(self):
         """Show professional no data available message"""
-        no_data_frame = QFrame()
-        no_data_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border: 2px dashed {COLORS['border']};
-                border-radius: 12px;
-                padding: {SPACING['xxl']}px;
-                margin: {SPACING['lg']}px;
-            }}
-        """)
+        self._last_data_key = None
+        self.insights_widget.set_sections([(_ROW_NO_DATA, (), 320)])
         
-        no_data_layout = QVBoxLayout(no_data_frame)
-        no_data_layout.setAlignment(Qt.AlignCenter)
-        no_data_layout.setSpacing(SPACING['lg'])
+    def create_no_data_section(self):
+        """Create the no data available placeholder"""
+        no_data_frame = self._acquire_frame('noData', spacing=SPACING['lg'],
+                                            alignment=Qt.AlignCenter)
+        no_data_layout = no_data_frame.layout()
         
         # Icon
-        icon_label = QLabel("💡")
-        icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet("font-size: 48px; margin: 0;")
+        icon_label = self._acquire_label("💡", 'noDataIcon',
+                                         alignment=Qt.AlignCenter)
         
         # Title
-        no_data_label = QLabel("No Insights Available")
-        no_data_label.setAlignment(Qt.AlignCenter)
-        no_data_label.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_primary']};
-                font-size: 20px;
-                font-weight: 600;
-                margin: 0;
-            }}
-        """)
+        no_data_label = self._acquire_label("No Insights Available", 'noDataTitle',
+                                            alignment=Qt.AlignCenter)
         
         # Description
-        desc_label = QLabel("Upload equipment data to generate comprehensive insights and recommendations")
-        desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setWordWrap(True)
-        desc_label.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_secondary']};
-                font-size: {TYPOGRAPHY['body']['size']}px;
-                margin: 0;
-                max-width: 400px;
-            }}
-        """)
+        desc_label = self._acquire_label(
+            "Upload equipment data to generate comprehensive insights and recommendations",
+            'noDataDesc', word_wrap=True, alignment=Qt.AlignCenter)
         
         no_data_layout.addWidget(icon_label)
         no_data_layout.addWidget(no_data_label)
         no_data_layout.addWidget(desc_label)
         
-        self.insights_layout.addWidget(no_data_frame)
\ No newline at end of file
+        return no_data_frame
+        
+    def _acquire_frame(self, name, spacing=-1, margins=None, alignment=Qt.Alignment(), variant=None):
+        """Get a QFrame with an empty QVBoxLayout, reusing a pooled one if available"""
+        if self._frame_pool:
+            frame = self._frame_pool.pop()
+        else:
+            frame = QFrame()
+            QVBoxLayout(frame)
+            frame.default_margins = frame.layout().contentsMargins()
+        
+        layout = frame.layout()
+        layout.setSpacing(spacing)
+        if margins is None:
+            layout.setContentsMargins(frame.default_margins)
+        else:
+            layout.setContentsMargins(*margins)
+        layout.setAlignment(alignment)
+        
+        self._set_style_selectors(frame, name, variant)
+        return frame
+        
+    def _acquire_label(self, text, name, word_wrap=False, alignment=_LABEL_ALIGNMENT):
+        """Get a QLabel showing text, reusing a pooled one if available"""
+        label = self._label_pool.pop() if self._label_pool else QLabel()
+        
+        if label.text() != text:
+            label.setText(text)
+        self._set_style_selectors(label, name)
+        label.setWordWrap(word_wrap)
+        label.setAlignment(alignment)
+        return label
+        
+    def _acquire_html_label(self, html, name):
+        """Get a pre-rendered static HTML label, reusing a pooled one if available"""
+        label = self._html_label_pool.pop() if self._html_label_pool else _HtmlSnapshotLabel()
+        
+        label.set_html(html)
+        self._set_style_selectors(label, name)
+        return label
+        
+    def _set_style_selectors(self, widget, name, variant=None):
+        """Point the panel stylesheet at a widget via its object name and variant"""
+        if widget.objectName() == name and widget.property('variant') == variant:
+            return
+        widget.setObjectName(name)
+        widget.setProperty('variant', variant)
+        # Pooled widgets keep their old style until re-polished
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+        
+    def _release_widget(self, widget):
+        """Return a built frame or label, and everything inside it, to the pools"""
+        layout = widget.layout()
+        if layout is not None:
+            while layout.count():
+                child = layout.takeAt(0).widget()
+                if child is not None:
+                    self._release_widget(child)
+        
+        widget.setParent(None)
+        if isinstance(widget, _HtmlSnapshotLabel):
+            self._html_label_pool.append(widget)
+        elif isinstance(widget, QLabel):
+            self._label_pool.append(widget)
+        else:
+            self._frame_pool.append(widget)
\ No newline at end of file
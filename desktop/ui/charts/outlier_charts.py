@@ -3,28 +3,239 @@ Outlier Charts - Professional card-based layout
 Clean, modern analytics dashboard design
 """
 
-import matplotlib.pyplot as plt
+import logging
+from collections import namedtuple
+
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QGridLayout, QFrame, QScrollArea)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 import numpy as np
 
 from ..design_system import (COLORS, SPACING, DIMENSIONS, CARD_STYLE,
                             get_section_title_style, get_card_title_style, 
-                            get_body_text_style, get_caption_style)
+                            get_body_text_style, get_caption_style, scoped_style)
+
+log = logging.getLogger(__name__)
+
+# Widget stylesheets, formatted once at import rather than per card
+_SECTION_TITLE_QSS = get_section_title_style()
+_CARD_TITLE_QSS = get_card_title_style()
+_BODY_QSS = get_body_text_style()
+_CAPTION_QSS = get_caption_style()
+
+_TRANSPARENT_FRAME_QSS = "QFrame { background: transparent; border: none; }"
+
+_HEADER_FRAME_QSS = f"""
+QFrame {{
+    background-color: transparent;
+    border: none;
+    padding: 0;
+    margin-bottom: {SPACING['md']}px;
+}}
+"""
+
+_SCROLL_AREA_QSS = f"""
+QScrollArea {{
+    border: none;
+    background-color: transparent;
+}}
+QScrollBar:vertical {{
+    background-color: {COLORS['surface_variant']};
+    width: 12px;
+    border-radius: 6px;
+}}
+QScrollBar::handle:vertical {{
+    background-color: {COLORS['primary']};
+    border-radius: 6px;
+    min-height: 20px;
+}}
+"""
+
+_NO_DETAILS_QSS = f"""
+QLabel {{
+    color: {COLORS['text_disabled']};
+    font-style: italic;
+    padding: {SPACING['xl']}px;
+    font-size: 16px;
+}}
+"""
+
+_PARAM_CARD_QSS = f"""
+QFrame {{
+    background-color: {COLORS['surface_variant']};
+    border: 1px solid {COLORS['border']};
+    border-radius: 8px;
+    padding: {SPACING['lg']}px;
+    margin-bottom: {SPACING['md']}px;
+}}
+"""
+
+_PARAM_TITLE_QSS = f"""
+QLabel {{
+    font-size: 16px;
+    font-weight: bold;
+    color: {COLORS['text_primary']};
+    margin-bottom: {SPACING['sm']}px;
+}}
+"""
+
+_OUTLIERS_FRAME_QSS = f"""
+QFrame {{
+    background-color: {COLORS['surface']};
+    border: 1px solid {COLORS['border_light']};
+    border-radius: 6px;
+    padding: {SPACING['md']}px;
+}}
+"""
+
+_OUTLIERS_TITLE_QSS = f"""
+QLabel {{
+    font-weight: bold;
+    color: {COLORS['text_primary']};
+    margin-bottom: {SPACING['xs']}px;
+}}
+"""
+
+_OUTLIER_LABEL_QSS = f"""
+QLabel {{
+    margin-left: {SPACING['md']}px;
+    color: {COLORS['text_secondary']};
+    font-size: 13px;
+}}
+"""
+
+_MORE_LABEL_QSS = f"""
+QLabel {{
+    margin-left: {SPACING['md']}px;
+    color: {COLORS['text_disabled']};
+    font-style: italic;
+    font-size: 12px;
+}}
+"""
+
+_STAT_CARD_QSS = f"""
+QFrame {{
+    background-color: {COLORS['surface']};
+    border: 1px solid {COLORS['border_light']};
+    border-radius: 6px;
+    padding: {SPACING['sm']}px;
+    min-height: 60px;
+}}
+"""
+
+_STAT_VALUE_QSS = f"""
+QLabel {{
+    font-size: 16px;
+    font-weight: bold;
+    color: {COLORS['primary']};
+    margin: 0;
+}}
+"""
+
+_STAT_TITLE_QSS = f"""
+QLabel {{
+    font-size: 12px;
+    color: {COLORS['text_secondary']};
+    margin: 0;
+}}
+"""
+
+# One stylesheet for the charts, details and parameter cards; widgets are
+# matched by object name. Container rules also match descendant QFrames
+# (QLabel included) to keep the cascade the per-widget "QFrame { ... }" sheets
+# used to produce, outer containers first so inner ones win; label rules come
+# last so they win over container rules of equal specificity.
+_OUTLIER_QSS = "\n".join([
+    scoped_style("QFrame#chartsFrame, #chartsFrame QFrame", _TRANSPARENT_FRAME_QSS),
+    scoped_style("QFrame#chartCard, #chartCard QFrame", CARD_STYLE),
+    scoped_style("QFrame#paramCard, #paramCard QFrame", _PARAM_CARD_QSS),
+    scoped_style("QFrame#statCard, #statCard QFrame", _STAT_CARD_QSS),
+    scoped_style("QFrame#outliersFrame, #outliersFrame QFrame", _OUTLIERS_FRAME_QSS),
+    scoped_style("#chartCard QLabel#cardTitle", _CARD_TITLE_QSS),
+    scoped_style("#chartCard QLabel#caption", _CAPTION_QSS),
+    scoped_style("#chartCard QLabel#noDetails", _NO_DETAILS_QSS),
+    scoped_style("#paramCard QLabel#paramTitle", _PARAM_TITLE_QSS),
+    scoped_style("#statCard QLabel#statValue", _STAT_VALUE_QSS),
+    scoped_style("#statCard QLabel#statTitle", _STAT_TITLE_QSS),
+    scoped_style("#outliersFrame QLabel#outliersTitle", _OUTLIERS_TITLE_QSS),
+    scoped_style("#outliersFrame QLabel#outlierLabel", _OUTLIER_LABEL_QSS),
+    scoped_style("#outliersFrame QLabel#moreLabel", _MORE_LABEL_QSS),
+])
+
+# Fixed axes rectangles (figure fractions) in place of a per-update
+# tight_layout pass: bar axes leave room for the y label and x ticks, the pie
+# for its outside labels, and tick-less message axes fill the figure
+_BAR_AXES_RECT = (0.12, 0.15, 0.83, 0.78)
+_PIE_AXES_RECT = (0.2, 0.1, 0.6, 0.8)
+_MESSAGE_AXES_RECT = (0.03, 0.04, 0.94, 0.92)
+
+# Professional color palette for the distribution pie
+_PIE_COLORS = (COLORS['error'], COLORS['warning'], COLORS['info'],
+               COLORS['success'], COLORS['primary'])
+
+def _count_label(count):
+    """Bar value label for an outlier count; zero bars are left unlabelled"""
+    return f'{int(count)}' if count > 0 else ''
+
+# One parameter's basic_analysis entry; count is None when it has no outlier_count
+_ParamStats = namedtuple('_ParamStats', 'count pct normal_range lower upper outliers')
+
+def _parse_param_stats(basic_analysis):
+    """Map each parameter with a dict entry in basic_analysis to its _ParamStats"""
+    param_stats = {}
+    for parameter, data in basic_analysis.items():
+        if not isinstance(data, dict):
+            continue
+        threshold_info = data.get('threshold_info') or {}
+        if threshold_info:
+            lower = threshold_info.get('lower_bound', 'N/A')
+            upper = threshold_info.get('upper_bound', 'N/A')
+        else:
+            lower = upper = None
+        param_stats[parameter] = _ParamStats(data.get('outlier_count'),
+                                             data.get('outlier_percentage', 0),
+                                             data.get('normal_range', 'N/A'),
+                                             lower, upper,
+                                             data.get('outliers', []))
+    return param_stats
+
+def _parameter_names(param_stats):
+    """Parameter names of param_stats as an object array, for boolean masking"""
+    names = np.empty(len(param_stats), dtype=object)
+    names[:] = list(param_stats)
+    return names
 
 class OutlierCharts(QWidget):
     """Professional outlier charts with card-based layout"""
     
+    # Quiet period before a burst of update_data calls is rendered
+    UPDATE_DELAY_MS = 50
+    
     def __init__(self):
         super().__init__()
         self.analysis_data = None
+        # Parameter name -> details card, reused across refreshes
+        self._param_cards = {}
+        # Latest results waiting for the debounced refresh
+        self._pending_update = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_DELAY_MS)
+        self._update_timer.timeout.connect(self._flush_update)
+        # Details are rebuilt on a later event-loop pass than the charts
+        self._pending_details = None
+        self._details_timer = QTimer(self)
+        self._details_timer.setSingleShot(True)
+        self._details_timer.setInterval(0)
+        self._details_timer.timeout.connect(self._flush_details)
         self.init_ui()
         
     def init_ui(self):
         """Initialize outlier UI with professional layout"""
+        self.setStyleSheet(_OUTLIER_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(SPACING['lg'], SPACING['lg'], SPACING['lg'], SPACING['lg'])
         layout.setSpacing(SPACING['lg'])
@@ -41,14 +252,7 @@ class OutlierCharts(QWidget):
     def create_section_header(self, layout):
         """Create section header with title and description"""
         header_frame = QFrame()
-        header_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: transparent;
-                border: none;
-                padding: 0;
-                margin-bottom: {SPACING['md']}px;
-            }}
-        """)
+        header_frame.setStyleSheet(_HEADER_FRAME_QSS)
         
         header_layout = QVBoxLayout(header_frame)
         header_layout.setContentsMargins(0, 0, 0, 0)
@@ -56,11 +260,11 @@ class OutlierCharts(QWidget):
         
         # Title
         title_label = QLabel("Outlier Detection")
-        title_label.setStyleSheet(get_section_title_style())
+        title_label.setStyleSheet(_SECTION_TITLE_QSS)
         
         # Description
         desc_label = QLabel("Identification and analysis of equipment operating outside normal parameters")
-        desc_label.setStyleSheet(get_body_text_style())
+        desc_label.setStyleSheet(_BODY_QSS)
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(desc_label)
@@ -70,7 +274,7 @@ class OutlierCharts(QWidget):
     def create_charts_section(self, layout):
         """Create outlier charts section"""
         charts_frame = QFrame()
-        charts_frame.setStyleSheet("QFrame { background: transparent; border: none; }")
+        charts_frame.setObjectName("chartsFrame")
         
         charts_layout = QHBoxLayout(charts_frame)
         charts_layout.setSpacing(SPACING['md'])
@@ -96,7 +300,7 @@ class OutlierCharts(QWidget):
     def create_details_section(self, layout):
         """Create outlier analysis details section"""
         details_frame = QFrame()
-        details_frame.setStyleSheet(CARD_STYLE)
+        details_frame.setObjectName("chartCard")
         
         details_layout = QVBoxLayout(details_frame)
         details_layout.setSpacing(SPACING['md'])
@@ -106,10 +310,10 @@ class OutlierCharts(QWidget):
         header_layout.setSpacing(SPACING['xs'])
         
         title_label = QLabel("Outlier Analysis Details")
-        title_label.setStyleSheet(get_card_title_style())
+        title_label.setObjectName("cardTitle")
         
         desc_label = QLabel("Detailed breakdown of outlier detection results")
-        desc_label.setStyleSheet(get_caption_style())
+        desc_label.setObjectName("caption")
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(desc_label)
@@ -119,22 +323,7 @@ class OutlierCharts(QWidget):
         scroll_area.setWidgetResizable(True)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-            QScrollBar:vertical {{
-                background-color: {COLORS['surface_variant']};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {COLORS['primary']};
-                border-radius: 6px;
-                min-height: 20px;
-            }}
-        """)
+        scroll_area.setStyleSheet(_SCROLL_AREA_QSS)
         
         self.details_widget = QWidget()
         self.details_layout = QVBoxLayout(self.details_widget)
@@ -150,7 +339,7 @@ class OutlierCharts(QWidget):
     def create_chart_card(self, title, description):
         """Create a professional chart card"""
         card = QFrame()
-        card.setStyleSheet(CARD_STYLE)
+        card.setObjectName("chartCard")
         
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(SPACING['md'])
@@ -160,17 +349,17 @@ class OutlierCharts(QWidget):
         header_layout.setSpacing(SPACING['xs'])
         
         title_label = QLabel(title)
-        title_label.setStyleSheet(get_card_title_style())
+        title_label.setObjectName("cardTitle")
         
         desc_label = QLabel(description)
-        desc_label.setStyleSheet(get_caption_style())
+        desc_label.setObjectName("caption")
         desc_label.setWordWrap(True)
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(desc_label)
         
         # Chart area
-        figure = Figure(figsize=(6, 4), dpi=100)
+        figure = Figure(figsize=(6, 4), dpi=DIMENSIONS['chart_dpi'])
         figure.patch.set_facecolor('white')
         canvas = FigureCanvas(figure)
         canvas.setMinimumSize(DIMENSIONS['chart_min_width'], DIMENSIONS['chart_min_height'])
@@ -181,126 +370,251 @@ class OutlierCharts(QWidget):
         # Store figure and canvas
         card.figure = figure
         card.canvas = canvas
+        # Persistent data axes, created on first update
+        card.ax = None
+        # Empty-state axes, built once and toggled; _state is 'data' or 'empty'
+        card._empty_ax = None
+        card._state = None
         
         return card
         
     def update_data(self, analysis_results):
-        """Update outlier charts with new analysis data"""
+        """Update outlier charts with new analysis data
+        
+        Rendering is debounced: only the last of several calls arriving within
+        UPDATE_DELAY_MS of each other is drawn. While the widget is hidden
+        (e.g. on another dashboard tab) the results are only stored and are
+        rendered once it is shown.
+        """
         self.analysis_data = analysis_results
+        self._pending_update = analysis_results
+        if self.isVisible():
+            self._update_timer.start()
+            
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_update is not None:
+            self._update_timer.start()
+        
+    def _flush_update(self):
+        """Render the most recent results passed to update_data"""
+        # Hidden again before the timer fired; showEvent restarts it
+        if not self.isVisible():
+            return
+        analysis_results = self._pending_update
+        self._pending_update = None
+        if analysis_results is None:
+            return
         
         try:
-            print("DEBUG: Starting outlier charts update...")
+            log.debug("Starting outlier charts update")
+            # Parsed once here and shared by the charts and the details pass
+            outliers = analysis_results.get('outliers', {})
+            param_stats = _parse_param_stats(outliers.get('basic_analysis', {}))
+            
             # Update outlier charts
-            self.update_outlier_charts(analysis_results)
-            print("DEBUG: Outlier charts updated successfully")
+            self.update_outlier_charts(param_stats)
+            log.debug("Outlier charts updated successfully")
             
+        except Exception:
+            log.exception("Error in outlier charts update")
+            # Show error message in charts
+            self.show_no_data_message()
+            return
+        
+        # Let the event loop paint the charts before the details are rebuilt
+        self._pending_details = param_stats
+        self._details_timer.start()
+        
+    def _flush_details(self):
+        """Rebuild the details section for the last rendered results"""
+        param_stats = self._pending_details
+        self._pending_details = None
+        # A newer update is queued and will schedule its own details pass
+        if param_stats is None or self._pending_update is not None:
+            return
+        
+        try:
             # Update outlier details
-            self.update_outlier_details(analysis_results)
-            print("DEBUG: Outlier details updated successfully")
+            self.update_outlier_details(param_stats)
+            log.debug("Outlier details updated successfully")
             
-        except Exception as e:
-            print(f"ERROR: Error in outlier charts update: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("Error in outlier details update")
             # Show error message in charts
             self.show_no_data_message()
         
-    def update_outlier_charts(self, analysis_results):
-        """Update outlier charts"""
-        outliers = analysis_results.get('outliers', {})
-        basic_analysis = outliers.get('basic_analysis', {})
-        
-        if not basic_analysis:
+    def update_outlier_charts(self, param_stats):
+        """Update outlier charts from the parsed parameter stats"""
+        if not param_stats:
             self.show_no_data_message()
             return
             
         # Update outlier summary chart
-        self.update_summary_chart(basic_analysis)
+        self.update_summary_chart(param_stats)
         
         # Update outlier distribution chart
-        self.update_distribution_chart(basic_analysis)
+        self.update_distribution_chart(param_stats)
         
-    def update_summary_chart(self, basic_analysis):
+    def update_summary_chart(self, param_stats):
         """Update outlier summary bar chart"""
-        figure = self.summary_chart_widget.figure
-        figure.clear()
-        
-        ax = figure.add_subplot(111)
-        
-        # Prepare outlier count data
-        parameters = []
-        outlier_counts = []
-        
-        for parameter, data in basic_analysis.items():
-            if isinstance(data, dict) and 'outlier_count' in data:
-                parameters.append(parameter)
-                outlier_counts.append(data.get('outlier_count', 0))
-        
-        if not parameters or all(count == 0 for count in outlier_counts):
+        card = self.summary_chart_widget
+        
+        # Prepare outlier count data; NaN marks parameters without a count
+        counts = np.fromiter((np.nan if stats.count is None else stats.count
+                              for stats in param_stats.values()),
+                             dtype=float, count=len(param_stats))
+        has_count = ~np.isnan(counts)
+        parameters = _parameter_names(param_stats)[has_count].tolist()
+        outlier_counts = counts[has_count]
+        
+        if not outlier_counts.any():
+            self._reset_figure(card)
+            
+            ax = card.figure.add_axes(_MESSAGE_AXES_RECT)
             ax.text(0.5, 0.5, 'No outlier data available', 
                    horizontalalignment='center', verticalalignment='center',
                    transform=ax.transAxes, fontsize=14, color=COLORS['text_disabled'])
             ax.set_xticks([])
             ax.set_yticks([])
-        else:
-            bars = ax.bar(parameters, outlier_counts, 
-                         color=COLORS['warning'], alpha=0.8,
-                         edgecolor=COLORS['border'], linewidth=1)
             
-            # Professional styling
-            ax.set_ylabel('Number of Outliers', fontsize=12, color=COLORS['text_secondary'])
-            ax.grid(True, alpha=0.3, color=COLORS['border'])
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color(COLORS['border'])
-            ax.spines['bottom'].set_color(COLORS['border'])
-            ax.tick_params(colors=COLORS['text_secondary'])
-            
-            # Add value labels on bars
-            for bar, count in zip(bars, outlier_counts):
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.02,
-                           f'{int(count)}', ha='center', va='bottom',
-                           fontsize=10, color=COLORS['text_primary'], fontweight='bold')
-        
-        figure.tight_layout()
-        self.summary_chart_widget.canvas.draw()
-        
-    def update_distribution_chart(self, basic_analysis):
-        """Update outlier distribution pie chart"""
-        figure = self.distribution_widget.figure
-        figure.clear()
+            card.canvas.draw_idle()
+            return
+        
+        ax = self._get_summary_axes()
+        max_count = outlier_counts.max()
+        y_top = ax.get_ylim()[1]
+        
+        if parameters == card._parameters and max_count * 1.05 <= y_top <= max_count * 1.5:
+            # Same bars and axis scale: move the existing artists and blit them
+            for bar, label, count in zip(card._bar_container, card._value_texts, outlier_counts):
+                bar.set_height(count)
+                # bar_label anchors each label at its bar's top edge
+                label.xy = (bar.get_x() + bar.get_width()/2., count)
+                label.set_text(_count_label(count))
+            self._blit_summary_bars()
+            return
+        
+        # Categories or scale changed: rebuild the bars and redraw the axes
+        if card._bar_container is not None:
+            card._bar_container.remove()
+        for text in card._value_texts:
+            text.remove()
+        
+        x = np.arange(len(parameters))
+        # Bars and labels are animated so they can be blitted over a cached background
+        bars = ax.bar(x, outlier_counts, 
+                     color=COLORS['warning'], alpha=0.8,
+                     edgecolor=COLORS['border'], linewidth=1, animated=True)
+        ax.set_xticks(x, parameters)
+        # Fixed headroom above the tallest bar, so small count changes can be blitted
+        ax.set_ylim(0, max_count * 1.15)
+        ax.relim()
+        ax.autoscale_view()
+        
+        # Add value labels on bars; zero bars keep an empty label so positions line up
+        value_texts = ax.bar_label(bars, labels=[_count_label(count) for count in outlier_counts],
+                                   padding=3, fontsize=10, color=COLORS['text_primary'],
+                                   fontweight='bold', animated=True)
+        
+        card._parameters = parameters
+        card._bar_container = bars
+        card._value_texts = value_texts
+        
+        card.canvas.draw_idle()
+        
+    def _get_summary_axes(self):
+        """Get the summary chart axes, building and styling it once"""
+        card = self.summary_chart_widget
+        if card.ax is not None:
+            return card.ax
+        
+        self._reset_figure(card)
+        ax = card.figure.add_axes(_BAR_AXES_RECT)
+        
+        # Professional styling
+        ax.set_ylabel('Number of Outliers', fontsize=12, color=COLORS['text_secondary'])
+        ax.grid(True, alpha=0.3, color=COLORS['border'])
+        ax.set_axisbelow(True)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['left'].set_color(COLORS['border'])
+        ax.spines['bottom'].set_color(COLORS['border'])
+        ax.tick_params(colors=COLORS['text_secondary'])
+        
+        card.ax = ax
+        card._parameters = None
+        card._bar_container = None
+        card._value_texts = []
+        card._background = None
+        if not hasattr(card, '_draw_cid'):
+            card._draw_cid = card.canvas.mpl_connect('draw_event', self._on_summary_draw)
+        return ax
+        
+    def _on_summary_draw(self, event):
+        """Cache the static background after a full draw, then paint the bars on it"""
+        card = self.summary_chart_widget
+        if card.ax is None or card._bar_container is None:
+            return
+        canvas = card.canvas
+        # The whole figure, since value labels can rise above the axes
+        card._background = (canvas.copy_from_bbox(card.figure.bbox), canvas.get_width_height())
+        self._draw_summary_bars()
+        
+    def _draw_summary_bars(self):
+        """Draw the animated bars and value labels onto the canvas renderer"""
+        card = self.summary_chart_widget
+        ax = card.ax
+        for bar in card._bar_container:
+            ax.draw_artist(bar)
+        for text in card._value_texts:
+            ax.draw_artist(text)
+        
+    def _blit_summary_bars(self):
+        """Repaint the summary bars over the cached background"""
+        card = self.summary_chart_widget
+        canvas = card.canvas
+        if card._background is None or card._background[1] != canvas.get_width_height():
+            # Nothing cached at this size yet; the full draw caches it
+            canvas.draw_idle()
+            return
+        canvas.restore_region(card._background[0])
+        self._draw_summary_bars()
+        canvas.blit(card.figure.bbox)
         
-        ax = figure.add_subplot(111)
+    def update_distribution_chart(self, param_stats):
+        """Update outlier distribution pie chart"""
+        card = self.distribution_widget
         
         # Prepare percentage data
-        parameters = []
-        percentages = []
+        all_percentages = np.fromiter((stats.pct for stats in param_stats.values()),
+                                      dtype=float, count=len(param_stats))
+        has_outliers = all_percentages > 0  # Only include parameters with outliers
+        parameters = _parameter_names(param_stats)[has_outliers].tolist()
+        percentages = all_percentages[has_outliers]
+        
+        if parameters and card.ax is not None and parameters == card._pie_parameters:
+            # Same slices: re-angle the existing wedges instead of rebuilding the pie
+            self._update_pie_wedges(percentages)
+            card.canvas.draw_idle()
+            return
         
-        for parameter, data in basic_analysis.items():
-            if isinstance(data, dict) and 'outlier_percentage' in data:
-                percentage = data.get('outlier_percentage', 0)
-                if percentage > 0:  # Only include parameters with outliers
-                    parameters.append(parameter)
-                    percentages.append(percentage)
+        self._reset_figure(card)
         
-        if not parameters or all(p == 0 for p in percentages):
+        ax = card.figure.add_axes(_PIE_AXES_RECT if parameters else _MESSAGE_AXES_RECT)
+        
+        if not parameters:
             ax.text(0.5, 0.5, 'No outlier percentage data available', 
                    horizontalalignment='center', verticalalignment='center',
                    transform=ax.transAxes, fontsize=14, color=COLORS['text_disabled'])
             ax.set_xticks([])
             ax.set_yticks([])
         else:
-            # Professional color palette
-            colors = [COLORS['error'], COLORS['warning'], COLORS['info'], 
-                     COLORS['success'], COLORS['primary']]
-            
-            # Ensure we have enough colors
-            chart_colors = colors[:len(parameters)] if len(parameters) <= len(colors) else colors * ((len(parameters) // len(colors)) + 1)
+            # Cycle the palette when there are more slices than colors
+            chart_colors = [_PIE_COLORS[i % len(_PIE_COLORS)] for i in range(len(parameters))]
             
             wedges, texts, autotexts = ax.pie(percentages, labels=parameters, autopct='%1.1f%%',
-                                             colors=chart_colors[:len(parameters)], startangle=90,
+                                             colors=chart_colors, startangle=90,
                                              textprops={'fontsize': 10, 'color': COLORS['text_primary']})
             
             # Style the percentage text
@@ -308,173 +622,170 @@ class OutlierCharts(QWidget):
                 autotext.set_color('white')
                 autotext.set_fontweight('bold')
                 autotext.set_fontsize(9)
-        
-        figure.tight_layout()
-        self.distribution_widget.canvas.draw()
-        
-    def update_outlier_details(self, analysis_results):
-        """Update outlier details section"""
-        # Clear existing widgets
-        for i in reversed(range(self.details_layout.count())): 
-            child = self.details_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-        
-        outliers = analysis_results.get('outliers', {})
-        basic_analysis = outliers.get('basic_analysis', {})
-        
-        if not basic_analysis:
+            
+            card.ax = ax
+            card._pie_parameters = parameters
+            card._pie_artists = (wedges, texts, autotexts)
+        
+        card.canvas.draw_idle()
+        
+    def _update_pie_wedges(self, percentages):
+        """Move the cached pie wedges and labels to new percentages
+        
+        Mirrors the geometry ax.pie uses here: normalized fractions laid out
+        counter-clockwise from 90 degrees, labels at 1.1 radii and percentages
+        at 0.6 radii.
+        """
+        wedges, texts, autotexts = self.distribution_widget._pie_artists
+        fractions = np.asarray(percentages, dtype=float)
+        fractions /= fractions.sum()
+        
+        theta1 = 90.0
+        for wedge, text, autotext, frac in zip(wedges, texts, autotexts, fractions):
+            theta2 = theta1 + 360.0 * frac
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+            
+            thetam = np.deg2rad((theta1 + theta2) / 2.0)
+            x, y = np.cos(thetam), np.sin(thetam)
+            text.set_position((1.1 * x, 1.1 * y))
+            text.set_horizontalalignment('left' if x > 0 else 'right')
+            autotext.set_position((0.6 * x, 0.6 * y))
+            autotext.set_text('%1.1f%%' % (100 * frac))
+            theta1 = theta2
+        
+    def update_outlier_details(self, param_stats):
+        """Update outlier details section from the parsed parameter stats"""
+        # Cards whose parameter is still present are recycled below
+        for parameter in set(self._param_cards).difference(param_stats):
+            self._param_cards.pop(parameter).deleteLater()
+        recycled = set(self._param_cards.values())
+        
+        # Clear existing widgets and the trailing stretch
+        while (item := self.details_layout.takeAt(0)) is not None:
+            child = item.widget()
+            if child is not None and child not in recycled:
+                child.deleteLater()
+        
+        if not param_stats:
             no_data_label = QLabel("No outlier analysis data available")
             no_data_label.setAlignment(Qt.AlignCenter)
-            no_data_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {COLORS['text_disabled']};
-                    font-style: italic;
-                    padding: {SPACING['xl']}px;
-                    font-size: 16px;
-                }}
-            """)
+            no_data_label.setObjectName("noDetails")
             self.details_layout.addWidget(no_data_label)
             return
         
-        # Create parameter analysis cards
-        for parameter, data in basic_analysis.items():
-            if isinstance(data, dict):
-                parameter_card = self.create_parameter_card(parameter, data)
-                self.details_layout.addWidget(parameter_card)
+        # Create parameter analysis cards, only updating the text of existing ones
+        for parameter, stats in param_stats.items():
+            parameter_card = self._param_cards.get(parameter)
+            if parameter_card is None:
+                parameter_card = self.create_parameter_card(parameter, stats)
+                self._param_cards[parameter] = parameter_card
+            else:
+                self.update_parameter_card(parameter_card, parameter, stats)
+            self.details_layout.addWidget(parameter_card)
         
         # Add stretch to push cards to top
         self.details_layout.addStretch()
         
-    def create_parameter_card(self, parameter, data):
+    def create_parameter_card(self, parameter, stats):
         """Create professional outlier analysis card for a parameter"""
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface_variant']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: {SPACING['lg']}px;
-                margin-bottom: {SPACING['md']}px;
-            }}
-        """)
+        card.setObjectName("paramCard")
         
-        layout = QVBoxLayout(card)
+        # One grid for the whole card: title, stat cards, thresholds and the
+        # outlier list each take a row, full-width rows spanning all 3 columns
+        layout = QGridLayout(card)
         layout.setSpacing(SPACING['md'])
         
         # Parameter title
-        title_label = QLabel(f"{parameter} Outlier Analysis")
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 16px;
-                font-weight: bold;
-                color: {COLORS['text_primary']};
-                margin-bottom: {SPACING['sm']}px;
-            }}
-        """)
-        layout.addWidget(title_label)
-        
-        # Statistics grid
-        stats_frame = QFrame()
-        stats_frame.setStyleSheet("QFrame { background: transparent; border: none; }")
-        stats_grid = QGridLayout(stats_frame)
-        stats_grid.setSpacing(SPACING['md'])
+        card.title_label = QLabel()
+        card.title_label.setObjectName("paramTitle")
+        layout.addWidget(card.title_label, 0, 0, 1, 3)
         
         # Create stat cards
-        normal_range = data.get('normal_range', 'N/A')
-        outlier_count = data.get('outlier_count', 0)
-        outlier_percentage = data.get('outlier_percentage', 0)
+        card.normal_card = self.create_stat_card("Normal Range", "")
+        card.count_card = self.create_stat_card("Outliers Found", "")
+        card.percentage_card = self.create_stat_card("Percentage", "")
         
-        normal_card = self.create_stat_card("Normal Range", str(normal_range))
-        count_card = self.create_stat_card("Outliers Found", str(outlier_count))
-        percentage_card = self.create_stat_card("Percentage", f"{outlier_percentage:.1f}%")
+        layout.addWidget(card.normal_card, 1, 0)
+        layout.addWidget(card.count_card, 1, 1)
+        layout.addWidget(card.percentage_card, 1, 2)
         
-        stats_grid.addWidget(normal_card, 0, 0)
-        stats_grid.addWidget(count_card, 0, 1)
-        stats_grid.addWidget(percentage_card, 0, 2)
+        # Threshold info, hidden when the parameter has none
+        card.threshold_card = self.create_stat_card("Thresholds", "")
+        layout.addWidget(card.threshold_card, 2, 0, 1, 3)
         
-        # Threshold info
-        threshold_info = data.get('threshold_info', {})
-        if threshold_info:
-            lower_bound = threshold_info.get('lower_bound', 'N/A')
-            upper_bound = threshold_info.get('upper_bound', 'N/A')
-            threshold_card = self.create_stat_card("Thresholds", f"{lower_bound} - {upper_bound}")
-            stats_grid.addWidget(threshold_card, 1, 0, 1, 3)
-        
-        layout.addWidget(stats_frame)
-        
-        # Outlier equipment list
-        outliers_list = data.get('outliers', [])
-        if outliers_list and len(outliers_list) > 0:
-            outliers_frame = QFrame()
-            outliers_frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {COLORS['surface']};
-                    border: 1px solid {COLORS['border_light']};
-                    border-radius: 6px;
-                    padding: {SPACING['md']}px;
-                }}
-            """)
-            
-            outliers_layout = QVBoxLayout(outliers_frame)
-            outliers_layout.setSpacing(SPACING['sm'])
-            
-            outliers_title = QLabel("Outlier Equipment:")
-            outliers_title.setStyleSheet(f"""
-                QLabel {{
-                    font-weight: bold;
-                    color: {COLORS['text_primary']};
-                    margin-bottom: {SPACING['xs']}px;
-                }}
-            """)
-            outliers_layout.addWidget(outliers_title)
-            
-            # Show first 5 outliers
-            for i, outlier in enumerate(outliers_list[:5]):
-                if isinstance(outlier, dict):
-                    equipment_name = outlier.get('equipment_name', 'Unknown')
-                    equipment_type = outlier.get('type', 'Unknown')
-                    value = outlier.get('value', 0)
-                    
-                    outlier_label = QLabel(f"• {equipment_name} ({equipment_type}): {value:.2f}")
-                    outlier_label.setStyleSheet(f"""
-                        QLabel {{
-                            margin-left: {SPACING['md']}px;
-                            color: {COLORS['text_secondary']};
-                            font-size: 13px;
-                        }}
-                    """)
-                    outliers_layout.addWidget(outlier_label)
-            
-            # Show count if more outliers exist
-            if len(outliers_list) > 5:
-                more_label = QLabel(f"... and {len(outliers_list) - 5} more outliers")
-                more_label.setStyleSheet(f"""
-                    QLabel {{
-                        margin-left: {SPACING['md']}px;
-                        color: {COLORS['text_disabled']};
-                        font-style: italic;
-                        font-size: 12px;
-                    }}
-                """)
-                outliers_layout.addWidget(more_label)
-            
-            layout.addWidget(outliers_frame)
+        # Outlier equipment list, hidden when there are no outliers
+        card.outliers_frame = QFrame()
+        card.outliers_frame.setObjectName("outliersFrame")
+        
+        card.outliers_layout = QVBoxLayout(card.outliers_frame)
+        card.outliers_layout.setSpacing(SPACING['sm'])
+        
+        outliers_title = QLabel("Outlier Equipment:")
+        outliers_title.setObjectName("outliersTitle")
+        card.outliers_layout.addWidget(outliers_title)
+        
+        # Labels for the first outliers are created on demand and reused
+        card.outlier_labels = []
+        
+        card.more_label = QLabel()
+        card.more_label.setObjectName("moreLabel")
+        card.outliers_layout.addWidget(card.more_label)
+        
+        layout.addWidget(card.outliers_frame, 3, 0, 1, 3)
         
+        self.update_parameter_card(card, parameter, stats)
         return card
         
+    def update_parameter_card(self, card, parameter, stats):
+        """Refresh the text of a parameter card created by create_parameter_card"""
+        card.title_label.setText(f"{parameter} Outlier Analysis")
+        
+        card.normal_card.value_label.setText(str(stats.normal_range))
+        card.count_card.value_label.setText(str(0 if stats.count is None else stats.count))
+        card.percentage_card.value_label.setText(f"{stats.pct:.1f}%")
+        
+        has_thresholds = stats.lower is not None or stats.upper is not None
+        if has_thresholds:
+            card.threshold_card.value_label.setText(f"{stats.lower} - {stats.upper}")
+        card.threshold_card.setVisible(has_thresholds)
+        
+        outliers_list = stats.outliers
+        card.outliers_frame.setVisible(bool(outliers_list))
+        if not outliers_list:
+            return
+        
+        # Show first 5 outliers
+        lines = []
+        for outlier in outliers_list[:5]:
+            if isinstance(outlier, dict):
+                equipment_name = outlier.get('equipment_name', 'Unknown')
+                equipment_type = outlier.get('type', 'Unknown')
+                value = outlier.get('value', 0)
+                lines.append(f"• {equipment_name} ({equipment_type}): {value:.2f}")
+        
+        labels = card.outlier_labels
+        while len(labels) < len(lines):
+            outlier_label = QLabel()
+            outlier_label.setObjectName("outlierLabel")
+            # After the title and any earlier outlier labels
+            card.outliers_layout.insertWidget(len(labels) + 1, outlier_label)
+            labels.append(outlier_label)
+        for i, outlier_label in enumerate(labels):
+            if i < len(lines):
+                outlier_label.setText(lines[i])
+            outlier_label.setVisible(i < len(lines))
+        
+        # Show count if more outliers exist
+        if len(outliers_list) > 5:
+            card.more_label.setText(f"... and {len(outliers_list) - 5} more outliers")
+        card.more_label.setVisible(len(outliers_list) > 5)
+        
     def create_stat_card(self, title, value):
         """Create a small stat card"""
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border: 1px solid {COLORS['border_light']};
-                border-radius: 6px;
-                padding: {SPACING['sm']}px;
-                min-height: 60px;
-            }}
-        """)
+        card.setObjectName("statCard")
         
         layout = QVBoxLayout(card)
         layout.setAlignment(Qt.AlignCenter)
@@ -483,60 +794,66 @@ class OutlierCharts(QWidget):
         # Value
         value_label = QLabel(value)
         value_label.setAlignment(Qt.AlignCenter)
-        value_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 16px;
-                font-weight: bold;
-                color: {COLORS['primary']};
-                margin: 0;
-            }}
-        """)
+        value_label.setObjectName("statValue")
         
         # Title
         title_label = QLabel(title)
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 12px;
-                color: {COLORS['text_secondary']};
-                margin: 0;
-            }}
-        """)
+        title_label.setObjectName("statTitle")
         
         layout.addWidget(value_label)
         layout.addWidget(title_label)
         
+        card.value_label = value_label
         return card
         
     def show_no_data_message(self):
         """Show professional no data available message"""
         for widget in [self.summary_chart_widget, self.distribution_widget]:
-            figure = widget.figure
-            figure.clear()
+            # Already showing it; nothing to redraw
+            if widget._state == 'empty':
+                continue
             
-            ax = figure.add_subplot(111)
-            
-            # Professional empty state styling
-            ax.text(0.5, 0.6, '📊', horizontalalignment='center', verticalalignment='center',
-                   transform=ax.transAxes, fontsize=32, alpha=0.3)
-            ax.text(0.5, 0.4, 'No outlier data available', 
-                   horizontalalignment='center', verticalalignment='center',
-                   transform=ax.transAxes, fontsize=14, color=COLORS['text_disabled'],
-                   fontweight='500')
-            ax.text(0.5, 0.3, 'Upload equipment data to see outlier analysis', 
-                   horizontalalignment='center', verticalalignment='center',
-                   transform=ax.transAxes, fontsize=12, color=COLORS['text_disabled'],
-                   style='italic')
-            
-            # Clean empty state appearance
-            ax.set_xticks([])
-            ax.set_yticks([])
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['bottom'].set_visible(False)
-            ax.spines['left'].set_visible(False)
-            ax.set_facecolor(COLORS['surface_variant'])
+            self._reset_figure(widget)
+            widget._state = 'empty'
+            if widget._empty_ax is None:
+                widget._empty_ax = self._create_empty_axes(widget.figure)
+            widget._empty_ax.set_visible(True)
+            widget.canvas.draw_idle()
             
-            figure.patch.set_facecolor('white')
-            figure.tight_layout()
-            widget.canvas.draw()
\ No newline at end of file
+    def _create_empty_axes(self, figure):
+        """Build the empty-state axes shown by show_no_data_message"""
+        ax = figure.add_axes(_MESSAGE_AXES_RECT)
+        
+        # Professional empty state styling
+        ax.text(0.5, 0.6, '📊', horizontalalignment='center', verticalalignment='center',
+               transform=ax.transAxes, fontsize=32, alpha=0.3)
+        ax.text(0.5, 0.4, 'No outlier data available', 
+               horizontalalignment='center', verticalalignment='center',
+               transform=ax.transAxes, fontsize=14, color=COLORS['text_disabled'],
+               fontweight='500')
+        ax.text(0.5, 0.3, 'Upload equipment data to see outlier analysis', 
+               horizontalalignment='center', verticalalignment='center',
+               transform=ax.transAxes, fontsize=12, color=COLORS['text_disabled'],
+               style='italic')
+        
+        # Clean empty state appearance
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['bottom'].set_visible(False)
+        ax.spines['left'].set_visible(False)
+        ax.set_facecolor(COLORS['surface_variant'])
+        
+        return ax
+        
+    def _reset_figure(self, card):
+        """Remove a chart card's data axes and hide its empty state"""
+        for ax in list(card.figure.axes):
+            if ax is not card._empty_ax:
+                ax.remove()
+        if card._empty_ax is not None:
+            card._empty_ax.set_visible(False)
+        card.ax = None
+        card._state = 'data'
@@ -3,18 +3,154 @@ Overview Charts - Professional card-based layout
 Clean, modern analytics dashboard design
 """
 
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QGridLayout, QFrame)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QFont
 import numpy as np
 
 from ..design_system import (COLORS, SPACING, DIMENSIONS, CARD_STYLE,
                             get_section_title_style, get_card_title_style, 
-                            get_body_text_style, get_caption_style)
+                            get_body_text_style, get_caption_style, scoped_style)
+
+# Widget stylesheets, formatted once at import rather than per card
+_SECTION_TITLE_QSS = get_section_title_style()
+_CARD_TITLE_QSS = get_card_title_style()
+_BODY_QSS = get_body_text_style()
+_CAPTION_QSS = get_caption_style()
+
+_TRANSPARENT_FRAME_QSS = "QFrame { background: transparent; border: none; }"
+
+_HEADER_FRAME_QSS = f"""
+QFrame {{
+    background-color: transparent;
+    border: none;
+    padding: 0;
+    margin-bottom: {SPACING['md']}px;
+}}
+"""
+
+_METRIC_CARD_QSS = f"""
+QFrame {{
+    background-color: {COLORS['surface']};
+    border: 1px solid {COLORS['border']};
+    border-radius: 8px;
+    padding: {SPACING['lg']}px;
+    min-height: 100px;
+}}
+"""
+
+_METRIC_VALUE_QSS = """
+QLabel {
+    font-size: 28px;
+    font-weight: bold;
+    margin: 0;
+}
+"""
+
+_TYPE_CARD_QSS = f"""
+QFrame {{
+    background-color: {COLORS['surface']};
+    border: 1px solid {COLORS['border']};
+    border-radius: 8px;
+    padding: {SPACING['md']}px;
+    min-width: 140px;
+    min-height: 80px;
+}}
+"""
+
+_TYPE_NAME_QSS = f"""
+QLabel {{
+    font-size: 14px;
+    font-weight: 600;
+    color: {COLORS['text_primary']};
+    margin: 0;
+}}
+"""
+
+_TYPE_PERCENTAGE_QSS = f"""
+QLabel {{
+    font-size: 16px;
+    font-weight: bold;
+    color: {COLORS['primary']};
+    margin: 0;
+}}
+"""
+
+# Metric value colors, selected with the "colorRole" property
+_METRIC_COLOR_ROLES = ('primary', 'info', 'success', 'warning')
+
+# Professional color palette for the type breakdown pie; ax.pie cycles it
+_PIE_COLORS = (COLORS['primary'], COLORS['info'], COLORS['success'],
+               COLORS['warning'], '#9c27b0', '#ff5722')
+
+# One stylesheet for the metrics, charts and type cards; widgets are matched
+# by object name. Container rules also match descendant QFrames (QLabel
+# included) to keep the cascade the per-widget "QFrame { ... }" sheets used to
+# produce, outer containers first so inner ones win; label rules come last so
+# they win over container rules of equal specificity.
+_OVERVIEW_QSS = "\n".join([
+    scoped_style("QFrame#metricsFrame, #metricsFrame QFrame", _TRANSPARENT_FRAME_QSS),
+    scoped_style("QFrame#chartsFrame, #chartsFrame QFrame", _TRANSPARENT_FRAME_QSS),
+    scoped_style("QFrame#chartCard, #chartCard QFrame", CARD_STYLE),
+    scoped_style("QFrame#typesContainer, #typesContainer QFrame", _TRANSPARENT_FRAME_QSS),
+    scoped_style("QFrame#metricCard, #metricCard QFrame", _METRIC_CARD_QSS),
+    scoped_style("QFrame#typeCard, #typeCard QFrame", _TYPE_CARD_QSS),
+    scoped_style("#metricCard QLabel#metricValue", _METRIC_VALUE_QSS),
+    *[f'#metricCard QLabel#metricValue[colorRole="{role}"] {{ color: {COLORS[role]}; }}'
+      for role in _METRIC_COLOR_ROLES],
+    scoped_style("#metricCard QLabel#body, #typeCard QLabel#body", _BODY_QSS),
+    scoped_style("#chartCard QLabel#cardTitle", _CARD_TITLE_QSS),
+    scoped_style("#chartCard QLabel#caption", _CAPTION_QSS),
+    scoped_style("#typeCard QLabel#typeName", _TYPE_NAME_QSS),
+    scoped_style("#typeCard QLabel#typePercentage", _TYPE_PERCENTAGE_QSS),
+])
+
+def _unpack_equipment_types(equipment_types):
+    """Split an equipment type distribution into a types tuple and a counts array"""
+    counts = np.fromiter(equipment_types.values(), dtype=np.int64, count=len(equipment_types))
+    return tuple(equipment_types), counts
+
+def _update_pie_wedges(artists, counts):
+    """Move cached pie wedges and labels to new counts
+    
+    Mirrors the geometry ax.pie uses here: normalized fractions laid out
+    counter-clockwise from 90 degrees, labels at 1.1 radii and percentages
+    at 0.6 radii.
+    """
+    wedges, texts, autotexts = artists
+    fractions = np.asarray(counts, dtype=float)
+    fractions /= fractions.sum()
+    
+    theta1 = 90.0
+    for wedge, text, autotext, frac in zip(wedges, texts, autotexts, fractions):
+        theta2 = theta1 + 360.0 * frac
+        wedge.set_theta1(theta1)
+        wedge.set_theta2(theta2)
+        
+        thetam = np.deg2rad((theta1 + theta2) / 2.0)
+        x, y = np.cos(thetam), np.sin(thetam)
+        text.set_position((1.1 * x, 1.1 * y))
+        text.set_horizontalalignment('left' if x > 0 else 'right')
+        autotext.set_position((0.6 * x, 0.6 * y))
+        autotext.set_text('%1.1f%%' % (100 * frac))
+        theta1 = theta2
+
+class _ChartCanvas(FigureCanvas):
+    """Figure canvas that keeps preferring the figure's initial size
+    
+    The stock canvas reports its current size as its size hint, so once it
+    has been laid out small it would never ask for more room again.
+    """
+    
+    def __init__(self, figure):
+        super().__init__(figure)
+        self._size_hint = QSize(*self.get_width_height())
+        
+    def sizeHint(self):
+        return self._size_hint
 
 class OverviewCharts(QWidget):
     """Professional overview charts with card-based layout"""
@@ -22,10 +158,16 @@ class OverviewCharts(QWidget):
     def __init__(self):
         super().__init__()
         self.analysis_data = None
+        # Fingerprint of the displayed values from the last refresh
+        self._last_data_key = None
+        # Type detail cards in layout order; extras are hidden, not destroyed
+        self._type_cards = []
         self.init_ui()
         
     def init_ui(self):
         """Initialize overview UI with professional layout"""
+        self.setStyleSheet(_OVERVIEW_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(SPACING['lg'], SPACING['lg'], SPACING['lg'], SPACING['lg'])
         layout.setSpacing(SPACING['lg'])
@@ -45,14 +187,7 @@ class OverviewCharts(QWidget):
     def create_section_header(self, layout):
         """Create section header with title and description"""
         header_frame = QFrame()
-        header_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: transparent;
-                border: none;
-                padding: 0;
-                margin-bottom: {SPACING['md']}px;
-            }}
-        """)
+        header_frame.setStyleSheet(_HEADER_FRAME_QSS)
         
         header_layout = QVBoxLayout(header_frame)
         header_layout.setContentsMargins(0, 0, 0, 0)
@@ -60,11 +195,11 @@ class OverviewCharts(QWidget):
         
         # Title
         title_label = QLabel("Dataset Overview")
-        title_label.setStyleSheet(get_section_title_style())
+        title_label.setStyleSheet(_SECTION_TITLE_QSS)
         
         # Description
         desc_label = QLabel("Key metrics and equipment distribution analysis")
-        desc_label.setStyleSheet(get_body_text_style())
+        desc_label.setStyleSheet(_BODY_QSS)
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(desc_label)
@@ -74,17 +209,17 @@ class OverviewCharts(QWidget):
     def create_metrics_section(self, layout):
         """Create key metrics cards"""
         metrics_frame = QFrame()
-        metrics_frame.setStyleSheet("QFrame { background: transparent; border: none; }")
+        metrics_frame.setObjectName("metricsFrame")
         
         metrics_layout = QHBoxLayout(metrics_frame)
         metrics_layout.setSpacing(SPACING['md'])
         metrics_layout.setContentsMargins(0, 0, 0, 0)
         
         # Create metric cards
-        self.total_equipment_card = self.create_metric_card("Total Equipment", "0", COLORS['primary'])
-        self.equipment_types_card = self.create_metric_card("Equipment Types", "0", COLORS['info'])
-        self.avg_flowrate_card = self.create_metric_card("Avg Flowrate", "0.0", COLORS['success'])
-        self.avg_temperature_card = self.create_metric_card("Avg Temperature", "0.0°C", COLORS['warning'])
+        self.total_equipment_card = self.create_metric_card("Total Equipment", "0", 'primary')
+        self.equipment_types_card = self.create_metric_card("Equipment Types", "0", 'info')
+        self.avg_flowrate_card = self.create_metric_card("Avg Flowrate", "0.0", 'success')
+        self.avg_temperature_card = self.create_metric_card("Avg Temperature", "0.0°C", 'warning')
         
         metrics_layout.addWidget(self.total_equipment_card)
         metrics_layout.addWidget(self.equipment_types_card)
@@ -93,18 +228,10 @@ class OverviewCharts(QWidget):
         
         layout.addWidget(metrics_frame)
         
-    def create_metric_card(self, title, value, color):
-        """Create a professional metric card"""
+    def create_metric_card(self, title, value, color_role):
+        """Create a professional metric card, its value colored by a _METRIC_COLOR_ROLES key"""
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: {SPACING['lg']}px;
-                min-height: 100px;
-            }}
-        """)
+        card.setObjectName("metricCard")
         
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(SPACING['sm'])
@@ -112,19 +239,13 @@ class OverviewCharts(QWidget):
         # Value (large number)
         value_label = QLabel(value)
         value_label.setAlignment(Qt.AlignCenter)
-        value_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 28px;
-                font-weight: bold;
-                color: {color};
-                margin: 0;
-            }}
-        """)
+        value_label.setObjectName("metricValue")
+        value_label.setProperty("colorRole", color_role)
         
         # Title (smaller text)
         title_label = QLabel(title)
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet(get_body_text_style())
+        title_label.setObjectName("body")
         
         card_layout.addWidget(value_label)
         card_layout.addWidget(title_label)
@@ -137,7 +258,7 @@ class OverviewCharts(QWidget):
     def create_charts_section(self, layout):
         """Create charts section with proper cards"""
         charts_frame = QFrame()
-        charts_frame.setStyleSheet("QFrame { background: transparent; border: none; }")
+        charts_frame.setObjectName("chartsFrame")
         
         charts_layout = QHBoxLayout(charts_frame)
         charts_layout.setSpacing(SPACING['md'])
@@ -148,6 +269,8 @@ class OverviewCharts(QWidget):
             "Equipment Distribution", 
             "Distribution of equipment types in the dataset"
         )
+        # Animated bars are painted over this cached full-canvas background
+        self.bar_chart_card._background = None
         
         # Pie chart card
         self.pie_chart_card = self.create_chart_card(
@@ -163,7 +286,7 @@ class OverviewCharts(QWidget):
     def create_chart_card(self, title, description):
         """Create a professional chart card"""
         card = QFrame()
-        card.setStyleSheet(CARD_STYLE)
+        card.setObjectName("chartCard")
         
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(SPACING['md'])
@@ -173,34 +296,54 @@ class OverviewCharts(QWidget):
         header_layout.setSpacing(SPACING['xs'])
         
         title_label = QLabel(title)
-        title_label.setStyleSheet(get_card_title_style())
+        title_label.setObjectName("cardTitle")
         
         desc_label = QLabel(description)
-        desc_label.setStyleSheet(get_caption_style())
+        desc_label.setObjectName("caption")
         desc_label.setWordWrap(True)
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(desc_label)
         
-        # Chart area
-        figure = Figure(figsize=(6, 4), dpi=100)
+        # Chart area; the figure and canvas replace this on first show
+        placeholder = QWidget()
+        placeholder.setMinimumSize(DIMENSIONS['chart_min_width'], DIMENSIONS['chart_min_height'])
+        
+        card_layout.addLayout(header_layout)
+        card_layout.addWidget(placeholder)
+        
+        card.placeholder = placeholder
+        card.figure = None
+        card.canvas = None
+        card.ax = None
+        # Categories drawn by the last rebuild and their artists
+        card._types = None
+        card._artists = None
+        
+        return card
+        
+    def _create_chart_canvas(self, card):
+        """Swap a chart card's placeholder for its figure canvas"""
+        # Constrained layout follows resizes and label changes on each full draw
+        figure = Figure(figsize=(6, 4), dpi=DIMENSIONS['chart_dpi'], layout='constrained')
         figure.patch.set_facecolor('white')
-        canvas = FigureCanvas(figure)
+        canvas = _ChartCanvas(figure)
         canvas.setMinimumSize(DIMENSIONS['chart_min_width'], DIMENSIONS['chart_min_height'])
         
-        card_layout.addLayout(header_layout)
-        card_layout.addWidget(canvas)
+        card.layout().replaceWidget(card.placeholder, canvas)
+        card.placeholder.deleteLater()
+        card.placeholder = None
         
         # Store figure and canvas
         card.figure = figure
         card.canvas = canvas
-        
-        return card
+        # Persistent axes; chart artists are updated in place across refreshes
+        card.ax = figure.add_subplot(111)
         
     def create_equipment_details_section(self, layout):
         """Create equipment type details section"""
         details_frame = QFrame()
-        details_frame.setStyleSheet(CARD_STYLE)
+        details_frame.setObjectName("chartCard")
         
         details_layout = QVBoxLayout(details_frame)
         details_layout.setSpacing(SPACING['md'])
@@ -210,18 +353,18 @@ class OverviewCharts(QWidget):
         header_layout.setSpacing(SPACING['xs'])
         
         title_label = QLabel("Equipment Type Details")
-        title_label.setStyleSheet(get_card_title_style())
+        title_label.setObjectName("cardTitle")
         
         desc_label = QLabel("Detailed breakdown of each equipment type")
-        desc_label.setStyleSheet(get_caption_style())
+        desc_label.setObjectName("caption")
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(desc_label)
         
-        # Types container
+        # Types container; pooled cards keep fixed row-0 cells
         self.types_container = QFrame()
-        self.types_container.setStyleSheet("QFrame { background: transparent; border: none; }")
-        self.types_layout = QHBoxLayout(self.types_container)
+        self.types_container.setObjectName("typesContainer")
+        self.types_layout = QGridLayout(self.types_container)
         self.types_layout.setSpacing(SPACING['md'])
         self.types_layout.setContentsMargins(0, 0, 0, 0)
         
@@ -230,18 +373,47 @@ class OverviewCharts(QWidget):
         
         layout.addWidget(details_frame)
         
-    def update_data(self, analysis_results):
-        """Update overview with new analysis data"""
-        self.analysis_data = analysis_results
+    def update_data(self, analysis_results, force=False):
+        """Update overview with new analysis data
         
-        # Update metrics
-        self.update_metrics(analysis_results)
+        Results that would display the same values are skipped; pass
+        force=True to refresh regardless.
+        """
+        data_key = self._data_key(analysis_results)
+        if not force and data_key == self._last_data_key:
+            return
+        self._last_data_key = data_key
+        self.analysis_data = analysis_results
         
-        # Update charts
-        self.update_charts(analysis_results)
+        # Unpacked once and shared by the charts and the detail cards
+        types, counts = self._equipment_types(analysis_results)
         
-        # Update equipment details
-        self.update_equipment_details(analysis_results)
+        # Repaint once for the whole refresh rather than per label and card
+        self.setUpdatesEnabled(False)
+        try:
+            # Update metrics
+            self.update_metrics(analysis_results)
+            
+            # Update charts
+            self.update_charts(types, counts)
+            
+            # Update equipment details
+            self.update_equipment_details(types, counts)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+    def _data_key(self, analysis_results):
+        """Fingerprint of the values the overview displays"""
+        summary_metrics = analysis_results.get('summary_metrics', {})
+        dataset_overview = summary_metrics.get('dataset_overview', {})
+        overall_stats = summary_metrics.get('overall_stats', {})
+        equipment_types = analysis_results.get('distributions', {}).get('equipment_types', {})
+        # Type order is kept, since it is the bar and slice order
+        return (dataset_overview.get('total_equipment_count'),
+                dataset_overview.get('equipment_types_count'),
+                overall_stats.get('Flowrate', {}).get('mean'),
+                overall_stats.get('Temperature', {}).get('mean'),
+                tuple(equipment_types.items()))
         
     def update_metrics(self, analysis_results):
         """Update metric cards"""
@@ -258,69 +430,151 @@ class OverviewCharts(QWidget):
         self.avg_flowrate_card.value_label.setText(f"{avg_flowrate:.1f}")
         self.avg_temperature_card.value_label.setText(f"{avg_temperature:.1f}°C")
         
-    def update_charts(self, analysis_results):
-        """Update chart visualizations"""
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.bar_chart_card.canvas is not None:
+            return
+        
+        # First show: build the figures, then draw any data that arrived before
+        for card in (self.bar_chart_card, self.pie_chart_card):
+            self._create_chart_canvas(card)
+        self.bar_chart_card.canvas.mpl_connect('draw_event', self._on_bar_chart_draw)
+        if self.analysis_data is not None:
+            self.update_charts(*self._equipment_types(self.analysis_data))
+        
+    def _equipment_types(self, analysis_results):
+        """Equipment types and their counts from the analysis results"""
         distributions = analysis_results.get('distributions', {})
-        equipment_types = distributions.get('equipment_types', {})
+        return _unpack_equipment_types(distributions.get('equipment_types', {}))
+        
+    def update_charts(self, types, counts):
+        """Update chart visualizations"""
+        # Not shown yet; showEvent draws the stored results
+        if self.bar_chart_card.canvas is None:
+            return
         
-        if not equipment_types:
+        if not types:
             return
             
         # Update bar chart
-        self.update_bar_chart(equipment_types)
+        self.update_bar_chart(types, counts)
         
         # Update pie chart
-        self.update_pie_chart(equipment_types)
+        self.update_pie_chart(types, counts)
         
-    def update_bar_chart(self, equipment_types):
+    def update_bar_chart(self, types, counts):
         """Update equipment distribution bar chart"""
-        figure = self.bar_chart_card.figure
-        figure.clear()
+        card = self.bar_chart_card
+        ax = card.ax
+        
+        if types == card._types:
+            # Same categories: move the existing bars and value labels
+            bars, value_texts = card._artists
+            for bar, label, count in zip(bars, value_texts, counts):
+                bar.set_height(count)
+                # bar_label anchors each label at its bar's top edge
+                label.xy = (label.xy[0], count)
+                label.set_text(f'{int(count)}')
+            ylim = ax.get_ylim()
+            ax.relim()
+            ax.autoscale_view()
+            if ax.get_ylim() == ylim:
+                # Same scale: only the bars and labels need repainting
+                self._blit_bar_chart()
+            else:
+                card.canvas.draw_idle()
+            return
+        
+        if card._artists is None:
+            self._style_bar_axes(ax)
+        else:
+            bars, value_texts = card._artists
+            bars.remove()
+            for text in value_texts:
+                text.remove()
         
-        ax = figure.add_subplot(111)
+        # Numeric positions, since a categorical axis would keep old categories
+        x = np.arange(len(types))
         
-        types = list(equipment_types.keys())
-        counts = list(equipment_types.values())
+        # Use professional color scheme; bars and labels are animated so they
+        # can be blitted over a cached background
+        bars = ax.bar(x, counts, color=COLORS['primary'], alpha=0.8, edgecolor=COLORS['border'],
+                      animated=True)
+        ax.set_xticks(x)
+        ax.set_xticklabels(types)
+        
+        # Add value labels on bars
+        value_texts = ax.bar_label(bars, fmt='%d', padding=2,
+                                   fontsize=10, color=COLORS['text_primary'], animated=True)
         
-        # Use professional color scheme
-        bars = ax.bar(types, counts, color=COLORS['primary'], alpha=0.8, edgecolor=COLORS['border'])
+        # Removed bars still count towards the data limits until relim
+        ax.relim()
+        ax.autoscale_view()
         
-        # Styling
+        card._types = types
+        card._artists = (bars, value_texts)
+        card.canvas.draw_idle()
+        
+    def _style_bar_axes(self, ax):
+        """Apply the bar chart's static styling, once per axes"""
         ax.set_ylabel('Count', fontsize=12, color=COLORS['text_secondary'])
         ax.tick_params(axis='x', rotation=45, labelsize=10, colors=COLORS['text_secondary'])
         ax.tick_params(axis='y', labelsize=10, colors=COLORS['text_secondary'])
         ax.grid(True, alpha=0.3, color=COLORS['border'])
+        # Animated bars are painted last anyway; keep full draws consistent
+        ax.set_axisbelow(True)
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.spines['left'].set_color(COLORS['border'])
         ax.spines['bottom'].set_color(COLORS['border'])
         
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                   f'{int(height)}', ha='center', va='bottom', 
-                   fontsize=10, color=COLORS['text_primary'])
-        
-        figure.tight_layout()
-        self.bar_chart_card.canvas.draw()
+    def _on_bar_chart_draw(self, event):
+        """Cache the static background after a full draw, then paint the bars on it"""
+        card = self.bar_chart_card
+        if card._artists is None:
+            return
+        canvas = card.canvas
+        # The whole canvas, since value labels can rise above the axes
+        card._background = (canvas.copy_from_bbox(card.figure.bbox), canvas.get_width_height())
+        self._draw_bar_artists()
+        
+    def _draw_bar_artists(self):
+        """Draw the animated bars and value labels onto the canvas renderer"""
+        card = self.bar_chart_card
+        bars, value_texts = card._artists
+        for artist in (*bars, *value_texts):
+            card.ax.draw_artist(artist)
+        
+    def _blit_bar_chart(self):
+        """Repaint the bar chart from the cached background"""
+        card = self.bar_chart_card
+        canvas = card.canvas
+        if card._background is None or card._background[1] != canvas.get_width_height():
+            # Nothing cached at this size yet; the full draw caches it
+            canvas.draw_idle()
+            return
+        canvas.restore_region(card._background[0])
+        self._draw_bar_artists()
+        canvas.blit(card.figure.bbox)
         
-    def update_pie_chart(self, equipment_types):
+    def update_pie_chart(self, types, counts):
         """Update equipment type pie chart"""
-        figure = self.pie_chart_card.figure
-        figure.clear()
-        
-        ax = figure.add_subplot(111)
+        card = self.pie_chart_card
+        ax = card.ax
         
-        types = list(equipment_types.keys())
-        counts = list(equipment_types.values())
+        if types == card._types:
+            # Same slices: re-angle the existing wedges instead of rebuilding the pie
+            _update_pie_wedges(card._artists, counts)
+            card.canvas.draw_idle()
+            return
         
-        # Professional color palette
-        colors = [COLORS['primary'], COLORS['info'], COLORS['success'], 
-                 COLORS['warning'], '#9c27b0', '#ff5722']
+        if card._artists is not None:
+            for artist_list in card._artists:
+                for artist in artist_list:
+                    artist.remove()
         
         wedges, texts, autotexts = ax.pie(counts, labels=types, autopct='%1.1f%%',
-                                         colors=colors[:len(types)], startangle=90,
+                                         colors=_PIE_COLORS, startangle=90,
                                          textprops={'fontsize': 10, 'color': COLORS['text_primary']})
         
         # Style the percentage text
@@ -329,80 +583,66 @@ class OverviewCharts(QWidget):
             autotext.set_fontweight('bold')
             autotext.set_fontsize(9)
         
-        figure.tight_layout()
-        self.pie_chart_card.canvas.draw()
-        
-    def update_equipment_details(self, analysis_results):
-        """Update equipment type detail cards"""
-        # Clear existing cards
-        for i in reversed(range(self.types_layout.count())): 
-            child = self.types_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-                
-        distributions = analysis_results.get('distributions', {})
-        equipment_types = distributions.get('equipment_types', {})
-        
-        if not equipment_types:
-            return
-            
-        total_count = sum(equipment_types.values())
-        
-        for equipment_type, count in equipment_types.items():
-            percentage = (count / total_count * 100) if total_count > 0 else 0
-            type_card = self.create_type_detail_card(equipment_type, count, percentage)
-            self.types_layout.addWidget(type_card)
+        card._types = types
+        card._artists = (wedges, texts, autotexts)
+        card.canvas.draw_idle()
+        
+    def update_equipment_details(self, types, counts):
+        """Update equipment type detail cards, reusing the pooled ones"""
+        # Percentages of the total in one vectorized step; all zero when it is 0
+        total_count = counts.sum()
+        percentages = np.divide(counts, total_count, out=np.zeros(len(counts)),
+                                where=total_count > 0) * 100.0
+        
+        for i, (equipment_type, count, percentage) in enumerate(zip(types, counts,
+                                                                    percentages)):
+            if i < len(self._type_cards):
+                type_card = self._type_cards[i]
+                self.update_type_detail_card(type_card, equipment_type, count, percentage)
+                type_card.setVisible(True)
+            else:
+                type_card = self.create_type_detail_card(equipment_type, count, percentage)
+                self._type_cards.append(type_card)
+                self.types_layout.addWidget(type_card, 0, i)
+        
+        # Hide cards left over from a refresh with more types
+        for type_card in self._type_cards[len(types):]:
+            type_card.setVisible(False)
             
     def create_type_detail_card(self, type_name, count, percentage):
         """Create professional equipment type detail card"""
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: {SPACING['md']}px;
-                min-width: 140px;
-                min-height: 80px;
-            }}
-        """)
+        card.setObjectName("typeCard")
         
         layout = QVBoxLayout(card)
         layout.setAlignment(Qt.AlignCenter)
         layout.setSpacing(SPACING['xs'])
         
         # Type name
-        type_label = QLabel(type_name)
-        type_label.setAlignment(Qt.AlignCenter)
-        type_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 14px;
-                font-weight: 600;
-                color: {COLORS['text_primary']};
-                margin: 0;
-            }}
-        """)
-        type_label.setWordWrap(True)
+        card.type_label = QLabel()
+        card.type_label.setAlignment(Qt.AlignCenter)
+        card.type_label.setObjectName("typeName")
+        card.type_label.setWordWrap(True)
         
         # Count
-        count_label = QLabel(f"{count} units")
-        count_label.setAlignment(Qt.AlignCenter)
-        count_label.setStyleSheet(get_body_text_style())
+        card.count_label = QLabel()
+        card.count_label.setAlignment(Qt.AlignCenter)
+        card.count_label.setObjectName("body")
         
         # Percentage
-        percentage_label = QLabel(f"{percentage:.1f}%")
-        percentage_label.setAlignment(Qt.AlignCenter)
-        percentage_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 16px;
-                font-weight: bold;
-                color: {COLORS['primary']};
-                margin: 0;
-            }}
-        """)
-        
-        layout.addWidget(type_label)
-        layout.addWidget(count_label)
-        layout.addWidget(percentage_label)
-        
-        return card
\ No newline at end of file
+        card.percentage_label = QLabel()
+        card.percentage_label.setAlignment(Qt.AlignCenter)
+        card.percentage_label.setObjectName("typePercentage")
+        
+        layout.addWidget(card.type_label)
+        layout.addWidget(card.count_label)
+        layout.addWidget(card.percentage_label)
+        
+        self.update_type_detail_card(card, type_name, count, percentage)
+        return card
+        
+    def update_type_detail_card(self, card, type_name, count, percentage):
+        """Refresh the text of a card created by create_type_detail_card"""
+        card.type_label.setText(type_name)
+        card.count_label.setText(f"{count} units")
+        card.percentage_label.setText(f"{percentage:.1f}%")
\ No newline at end of file
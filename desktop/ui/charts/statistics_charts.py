@@ -3,23 +3,141 @@ Statistics Charts - Professional card-based layout
 Clean, modern analytics dashboard design
 """
 
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
-                             QTableWidget, QTableWidgetItem, QHeaderView)
-from PyQt5.QtCore import Qt
+                             QTableView, QAbstractItemView, QHeaderView)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
 import numpy as np
 
 from ..design_system import (COLORS, SPACING, DIMENSIONS, CARD_STYLE,
                             get_section_title_style, get_card_title_style, 
                             get_body_text_style, get_caption_style)
 
+# Widget stylesheets, formatted once at import rather than per card
+_SECTION_TITLE_QSS = get_section_title_style()
+_CARD_TITLE_QSS = get_card_title_style()
+_BODY_QSS = get_body_text_style()
+_CAPTION_QSS = get_caption_style()
+
+_TRANSPARENT_FRAME_QSS = "QFrame { background: transparent; border: none; }"
+
+_HEADER_FRAME_QSS = f"""
+QFrame {{
+    background-color: transparent;
+    border: none;
+    padding: 0;
+    margin-bottom: {SPACING['md']}px;
+}}
+"""
+
+_TABLE_QSS = f"""
+QTableView {{
+    background-color: {COLORS['surface']};
+    border: 1px solid {COLORS['border']};
+    border-radius: 6px;
+    gridline-color: {COLORS['border_light']};
+    font-size: {SPACING['md']}px;
+}}
+QTableView::item {{
+    padding: {SPACING['sm']}px;
+    border-bottom: 1px solid {COLORS['border_light']};
+}}
+QTableView::item:selected {{
+    background-color: {COLORS['primary_light']};
+    color: white;
+}}
+QHeaderView::section {{
+    background-color: {COLORS['surface_variant']};
+    padding: {SPACING['md']}px;
+    border: none;
+    border-bottom: 2px solid {COLORS['primary']};
+    font-weight: 600;
+    color: {COLORS['text_primary']};
+}}
+"""
+
+# Parameters along the x axis of every chart and down the statistics table
+_PARAMETERS = ('Flowrate', 'Pressure', 'Temperature')
+
+# Statistics table columns after 'Parameter', as (header, statistical_summary key)
+_TABLE_STATS = (('Count', 'count'), ('Mean', 'mean'), ('Std Dev', 'std'), ('Min', 'min'),
+                ('Q1', '25%'), ('Median', '50%'), ('Q3', '75%'), ('Max', 'max'))
+
+# statistical_summary keys gathered per parameter, in statistics table column order
+_SUMMARY_KEYS = tuple(key for _, key in _TABLE_STATS)
+
+# Summary statistics drawn as bar series on the statistical summary chart
+_SUMMARY_CHART_STATS = ('mean', 'std', 'min', 'max')
+
+# Gap in points between a bar's top edge and its value label
+_LABEL_PADDING = 2
+
+def _parameter_matrix(section, keys):
+    """Gather section[param][key] into a (parameter x key) array, 0 where missing"""
+    return np.array([[section.get(param, {}).get(key, 0) for key in keys]
+                     for param in _PARAMETERS], dtype=np.float64)
+
+def _value_labels(values, value_format):
+    """Bar value label texts for values; bars that are not positive stay unlabelled"""
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(values > 0, np.char.mod(f'%{value_format}', values), '').tolist()
+
+class _StatsTableModel(QAbstractTableModel):
+    """Read-only model for the detailed statistics table
+    
+    Holds one row of _TABLE_STATS values per parameter and formats them only
+    when the view asks for display text.
+    """
+    
+    HEADERS = ('Parameter',) + tuple(header for header, _ in _TABLE_STATS)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._parameters = ()
+        self._values = np.empty((0, len(_TABLE_STATS)))
+        
+    def set_rows(self, parameters, values):
+        """Replace the table contents with a (parameters x _TABLE_STATS) array"""
+        self.beginResetModel()
+        self._parameters = tuple(parameters)
+        self._values = values
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._parameters)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole:
+            return None
+        
+        row, column = index.row(), index.column()
+        if column == 0:
+            return self._parameters[row]
+        value = self._values[row, column - 1]
+        # Count is a whole number; the rest are shown to two decimals
+        return f"{value:.0f}" if column == 1 else f"{value:.2f}"
+
 class StatisticsCharts(QWidget):
     """Professional statistics charts with card-based layout"""
     
     def __init__(self):
         super().__init__()
+        # Latest statistical_summary as a (parameter x _SUMMARY_KEYS) array
+        self._stats_matrix = None
+        self._last_data_key = None
         self.init_ui()
         
     def init_ui(self):
@@ -43,14 +161,7 @@ class StatisticsCharts(QWidget):
     def create_section_header(self, layout):
         """Create section header with title and description"""
         header_frame = QFrame()
-        header_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: transparent;
-                border: none;
-                padding: 0;
-                margin-bottom: {SPACING['md']}px;
-            }}
-        """)
+        header_frame.setStyleSheet(_HEADER_FRAME_QSS)
         
         header_layout = QVBoxLayout(header_frame)
         header_layout.setContentsMargins(0, 0, 0, 0)
@@ -58,11 +169,11 @@ class StatisticsCharts(QWidget):
         
         # Title
         title_label = QLabel("Statistical Analysis")
-        title_label.setStyleSheet(get_section_title_style())
+        title_label.setStyleSheet(_SECTION_TITLE_QSS)
         
         # Description
         desc_label = QLabel("Comprehensive statistical summary and distribution analysis")
-        desc_label.setStyleSheet(get_body_text_style())
+        desc_label.setStyleSheet(_BODY_QSS)
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(desc_label)
@@ -80,7 +191,7 @@ class StatisticsCharts(QWidget):
     def create_analysis_section(self, layout):
         """Create box plot and variance analysis section"""
         analysis_frame = QFrame()
-        analysis_frame.setStyleSheet("QFrame { background: transparent; border: none; }")
+        analysis_frame.setStyleSheet(_TRANSPARENT_FRAME_QSS)
         
         analysis_layout = QHBoxLayout(analysis_frame)
         analysis_layout.setSpacing(SPACING['md'])
@@ -116,53 +227,27 @@ class StatisticsCharts(QWidget):
         header_layout.setSpacing(SPACING['xs'])
         
         title_label = QLabel("Detailed Statistical Summary")
-        title_label.setStyleSheet(get_card_title_style())
+        title_label.setStyleSheet(_CARD_TITLE_QSS)
         
         desc_label = QLabel("Complete statistical breakdown for all parameters")
-        desc_label.setStyleSheet(get_caption_style())
+        desc_label.setStyleSheet(_CAPTION_QSS)
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(desc_label)
         
-        # Statistics table
-        self.stats_table = QTableWidget()
-        self.stats_table.setColumnCount(9)
-        self.stats_table.setHorizontalHeaderLabels([
-            'Parameter', 'Count', 'Mean', 'Std Dev', 'Min', 'Q1', 'Median', 'Q3', 'Max'
-        ])
+        # Statistics table, a view over a model refreshed in one reset
+        self.stats_model = _StatsTableModel(self)
+        self.stats_table = QTableView()
+        self.stats_table.setModel(self.stats_model)
         
         # Professional table styling
-        self.stats_table.setStyleSheet(f"""
-            QTableWidget {{
-                background-color: {COLORS['surface']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 6px;
-                gridline-color: {COLORS['border_light']};
-                font-size: {SPACING['md']}px;
-            }}
-            QTableWidget::item {{
-                padding: {SPACING['sm']}px;
-                border-bottom: 1px solid {COLORS['border_light']};
-            }}
-            QTableWidget::item:selected {{
-                background-color: {COLORS['primary_light']};
-                color: white;
-            }}
-            QHeaderView::section {{
-                background-color: {COLORS['surface_variant']};
-                padding: {SPACING['md']}px;
-                border: none;
-                border-bottom: 2px solid {COLORS['primary']};
-                font-weight: 600;
-                color: {COLORS['text_primary']};
-            }}
-        """)
+        self.stats_table.setStyleSheet(_TABLE_QSS)
         
         # Configure table behavior
         self.stats_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.stats_table.verticalHeader().setVisible(False)
         self.stats_table.setAlternatingRowColors(True)
-        self.stats_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.stats_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         
         table_layout.addLayout(header_layout)
         table_layout.addWidget(self.stats_table)
@@ -182,17 +267,18 @@ class StatisticsCharts(QWidget):
         header_layout.setSpacing(SPACING['xs'])
         
         title_label = QLabel(title)
-        title_label.setStyleSheet(get_card_title_style())
+        title_label.setStyleSheet(_CARD_TITLE_QSS)
         
         desc_label = QLabel(description)
-        desc_label.setStyleSheet(get_caption_style())
+        desc_label.setStyleSheet(_CAPTION_QSS)
         desc_label.setWordWrap(True)
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(desc_label)
         
         # Chart area
-        figure = Figure(figsize=(8, 5), dpi=100)
+        # Constrained layout follows resizes and label changes on each full draw
+        figure = Figure(figsize=(8, 5), dpi=DIMENSIONS['chart_dpi'], layout='constrained')
         figure.patch.set_facecolor('white')
         canvas = FigureCanvas(figure)
         canvas.setMinimumSize(DIMENSIONS['chart_min_width'], DIMENSIONS['chart_min_height'])
@@ -203,191 +289,211 @@ class StatisticsCharts(QWidget):
         # Store figure and canvas
         card.figure = figure
         card.canvas = canvas
+        # Axes, bar containers and value labels, kept across refreshes
+        card.ax = None
+        card._bars = []
+        card._value_texts = []
+        # Animated artists are painted over this cached full-canvas background
+        card._background = None
+        canvas.mpl_connect('draw_event', lambda event: self._on_chart_draw(card))
         
         return card
         
-    def update_data(self, analysis_results):
-        """Update statistics charts with new data"""
-        statistical_summary = analysis_results.get('summary_metrics', {}).get('statistical_summary', {})
-        overall_stats = analysis_results.get('summary_metrics', {}).get('overall_stats', {})
+    def update_data(self, analysis_results, force=False):
+        """Update statistics charts with new data
         
-        if statistical_summary:
-            self.update_statistical_chart(statistical_summary)
-            self.update_box_plot(overall_stats)
-            self.update_variance_chart(analysis_results.get('advanced_statistics', {}))
-            self.update_stats_table(statistical_summary)
-            
-    def update_statistical_chart(self, statistical_summary):
-        """Update statistical summary bar chart"""
-        figure = self.stats_chart.figure
-        figure.clear()
+        Results that would display the same values are skipped; pass
+        force=True to refresh regardless.
+        """
+        summary_metrics = analysis_results.get('summary_metrics', {})
+        statistical_summary = summary_metrics.get('statistical_summary', {})
+        if not statistical_summary:
+            return
         
-        ax = figure.add_subplot(111)
+        # One array read per chart series instead of nested dict lookups
+        stats_matrix = _parameter_matrix(statistical_summary, _SUMMARY_KEYS)
+        quartiles = _parameter_matrix(summary_metrics.get('overall_stats', {}),
+                                      ('q25', 'median', 'q75'))
+        variance_analysis = analysis_results.get('advanced_statistics', {}).get('variance_analysis', {})
+        spread = (_parameter_matrix(variance_analysis, ('variance', 'coefficient_of_variation'))
+                  if variance_analysis else None)
+        
+        # The matrices hold everything the charts and table display
+        data_key = (stats_matrix.tobytes(), quartiles.tobytes(),
+                    None if spread is None else spread.tobytes())
+        if not force and data_key == self._last_data_key:
+            return
+        self._last_data_key = data_key
+        self._stats_matrix = stats_matrix
         
-        parameters = ['Flowrate', 'Pressure', 'Temperature']
-        stats = ['mean', 'std', 'min', 'max']
+        self.update_statistical_chart(stats_matrix)
+        self.update_box_plot(quartiles)
+        self.update_variance_chart(spread)
+        self.update_stats_table(stats_matrix)
+            
+    def update_statistical_chart(self, stats_matrix):
+        """Update statistical summary bar chart from a _SUMMARY_KEYS column matrix"""
         colors = [COLORS['primary'], COLORS['info'], COLORS['warning'], COLORS['error']]
-        
-        x = np.arange(len(parameters))
         width = 0.2
         
-        for i, stat in enumerate(stats):
-            values = [statistical_summary.get(param, {}).get(stat, 0) for param in parameters]
-            bars = ax.bar(x + i * width, values, width, label=stat.capitalize(), 
-                         color=colors[i], alpha=0.8, edgecolor=COLORS['border'])
-            
-            # Add value labels on bars
-            for bar, value in zip(bars, values):
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                           f'{value:.1f}', ha='center', va='bottom', 
-                           fontsize=9, color=COLORS['text_primary'])
-            
-        # Professional styling
-        ax.set_xlabel('Parameters', fontsize=12, color=COLORS['text_secondary'])
-        ax.set_ylabel('Values', fontsize=12, color=COLORS['text_secondary'])
-        ax.set_xticks(x + width * 1.5)
-        ax.set_xticklabels(parameters)
-        ax.legend(frameon=True, fancybox=True, shadow=True)
-        ax.grid(True, alpha=0.3, color=COLORS['border'])
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_color(COLORS['border'])
-        ax.spines['bottom'].set_color(COLORS['border'])
-        ax.tick_params(colors=COLORS['text_secondary'])
-        
-        figure.tight_layout()
-        self.stats_chart.canvas.draw()
-        
-    def update_box_plot(self, overall_stats):
-        """Update box plot simulation"""
-        figure = self.box_plot_chart.figure
-        figure.clear()
+        groups = [(stat.capitalize(), colors[i], i * width,
+                   stats_matrix[:, _SUMMARY_KEYS.index(stat)])
+                  for i, stat in enumerate(_SUMMARY_CHART_STATS)]
+        self._update_bar_groups(self.stats_chart, groups, width, alpha=0.8,
+                                value_format='.1f', tick_offset=width * 1.5)
         
-        ax = figure.add_subplot(111)
-        
-        parameters = ['Flowrate', 'Pressure', 'Temperature']
+    def update_box_plot(self, quartiles):
+        """Update box plot simulation from a (parameter x Q1/median/Q3) matrix"""
         colors = [COLORS['primary'], COLORS['info'], COLORS['success']]
-        
-        x = np.arange(len(parameters))
         width = 0.25
         
-        q25_values = [overall_stats.get(param, {}).get('q25', 0) for param in parameters]
-        median_values = [overall_stats.get(param, {}).get('median', 0) for param in parameters]
-        q75_values = [overall_stats.get(param, {}).get('q75', 0) for param in parameters]
-        
-        bars1 = ax.bar(x - width, q25_values, width, label='Q1 (25%)', 
-                      color=colors[0], alpha=0.7, edgecolor=COLORS['border'])
-        bars2 = ax.bar(x, median_values, width, label='Median (50%)', 
-                      color=colors[1], alpha=0.7, edgecolor=COLORS['border'])
-        bars3 = ax.bar(x + width, q75_values, width, label='Q3 (75%)', 
-                      color=colors[2], alpha=0.7, edgecolor=COLORS['border'])
-        
-        # Add value labels
-        for bars, values in [(bars1, q25_values), (bars2, median_values), (bars3, q75_values)]:
-            for bar, value in zip(bars, values):
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                           f'{value:.1f}', ha='center', va='bottom', 
-                           fontsize=9, color=COLORS['text_primary'])
+        groups = [(label, colors[i], (i - 1) * width, quartiles[:, i])
+                  for i, label in enumerate(['Q1 (25%)', 'Median (50%)', 'Q3 (75%)'])]
+        self._update_bar_groups(self.box_plot_chart, groups, width, alpha=0.7,
+                                value_format='.1f')
         
-        # Professional styling
-        ax.set_xlabel('Parameters', fontsize=12, color=COLORS['text_secondary'])
-        ax.set_ylabel('Values', fontsize=12, color=COLORS['text_secondary'])
-        ax.set_xticks(x)
-        ax.set_xticklabels(parameters)
-        ax.legend(frameon=True, fancybox=True, shadow=True)
-        ax.grid(True, alpha=0.3, color=COLORS['border'])
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_color(COLORS['border'])
-        ax.spines['bottom'].set_color(COLORS['border'])
-        ax.tick_params(colors=COLORS['text_secondary'])
+    def update_variance_chart(self, spread):
+        """Update variance analysis chart from a (parameter x variance/CoV) matrix
         
-        figure.tight_layout()
-        self.box_plot_chart.canvas.draw()
+        spread is None when the results carry no variance analysis.
+        """
+        card = self.variance_chart
         
-    def update_variance_chart(self, advanced_stats):
-        """Update variance analysis chart"""
-        figure = self.variance_chart.figure
-        figure.clear()
-        
-        ax = figure.add_subplot(111)
-        
-        variance_analysis = advanced_stats.get('variance_analysis', {})
-        if not variance_analysis:
+        if spread is None:
+            figure = card.figure
+            figure.clear()
+            card.ax = None
+            card._background = None
+            
+            ax = figure.add_subplot(111)
             ax.text(0.5, 0.5, 'No variance data available', ha='center', va='center', 
                    transform=ax.transAxes, fontsize=14, color=COLORS['text_disabled'])
             ax.set_xticks([])
             ax.set_yticks([])
-            figure.tight_layout()
-            self.variance_chart.canvas.draw()
+            card.canvas.draw_idle()
             return
             
-        parameters = ['Flowrate', 'Pressure', 'Temperature']
-        variances = [variance_analysis.get(param, {}).get('variance', 0) for param in parameters]
-        cvs = [variance_analysis.get(param, {}).get('coefficient_of_variation', 0) for param in parameters]
-        
-        x = np.arange(len(parameters))
         width = 0.35
         
-        bars1 = ax.bar(x - width/2, variances, width, label='Variance', 
-                      color=COLORS['primary'], alpha=0.8, edgecolor=COLORS['border'])
-        bars2 = ax.bar(x + width/2, cvs, width, label='Coefficient of Variation', 
-                      color=COLORS['warning'], alpha=0.8, edgecolor=COLORS['border'])
+        groups = [('Variance', COLORS['primary'], -width/2, spread[:, 0]),
+                  ('Coefficient of Variation', COLORS['warning'], width/2, spread[:, 1])]
+        self._update_bar_groups(card, groups, width, alpha=0.8, value_format='.2f')
+        
+    def _update_bar_groups(self, card, groups, width, alpha, value_format, tick_offset=0.0):
+        """Show grouped bars with value labels on a chart card
+        
+        groups holds one (label, color, x offset, values) entry per bar series
+        over _PARAMETERS. The first call builds and styles the axes; later calls
+        move the existing bars and labels to the new values.
+        """
+        rebuilt = card.ax is None
+        if rebuilt:
+            self._build_bar_groups(card, groups, width, alpha, tick_offset)
+        ax = card.ax
+        ylim = ax.get_ylim()
+        
+        for bars, texts, (_, _, _, values) in zip(card._bars, card._value_texts, groups):
+            if not np.any(values):
+                # An all-zero series has nothing to show; hide it rather than
+                # draw flat bars and blank labels
+                for bar, text in zip(bars, texts):
+                    bar.set_height(0)
+                    bar.set_visible(False)
+                    text.set_visible(False)
+                continue
+            for bar, text, value, label in zip(bars, texts, values,
+                                               _value_labels(values, value_format)):
+                bar.set_height(value)
+                bar.set_visible(True)
+                # bar_label anchors each label at its bar's top edge
+                text.xy = (text.xy[0], value)
+                text.set_text(label)
+                text.set_visible(True)
+        
+        ax.relim()
+        ax.autoscale_view()
+        
+        if not rebuilt and ax.get_ylim() == ylim:
+            # Same scale: only the bars, labels and legend need repainting
+            self._blit_chart(card)
+            return
+        
+        card.canvas.draw_idle()
         
-        # Add value labels
-        for bars, values in [(bars1, variances), (bars2, cvs)]:
-            for bar, value in zip(bars, values):
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                           f'{value:.2f}', ha='center', va='bottom', 
-                           fontsize=9, color=COLORS['text_primary'])
+    def _build_bar_groups(self, card, groups, width, alpha, tick_offset):
+        """Create a chart card's grouped bar axes, bars and (empty) value labels"""
+        figure = card.figure
+        figure.clear()
+        
+        ax = figure.add_subplot(111)
+        x = np.arange(len(_PARAMETERS))
+        
+        # Bars, labels and the legend are animated so they can be blitted over
+        # a cached background
+        card._bars = []
+        card._value_texts = []
+        card._background = None
+        for label, color, offset, values in groups:
+            bars = ax.bar(x + offset, values, width, label=label,
+                          color=color, alpha=alpha, edgecolor=COLORS['border'],
+                          animated=True)
+            # Texts are filled in by _update_bar_groups
+            texts = ax.bar_label(bars, labels=[''] * len(bars), padding=_LABEL_PADDING,
+                                 fontsize=9, color=COLORS['text_primary'], animated=True)
+            # bar_label puts labels of negative bars below them; only positive
+            # bars are labelled, so every label sits above its bar
+            for text in texts:
+                text.xyann = (0, _LABEL_PADDING)
+                text.set_verticalalignment('bottom')
+            card._bars.append(bars)
+            card._value_texts.append(texts)
         
         # Professional styling
         ax.set_xlabel('Parameters', fontsize=12, color=COLORS['text_secondary'])
         ax.set_ylabel('Values', fontsize=12, color=COLORS['text_secondary'])
-        ax.set_xticks(x)
-        ax.set_xticklabels(parameters)
-        ax.legend(frameon=True, fancybox=True, shadow=True)
+        ax.set_xticks(x + tick_offset)
+        ax.set_xticklabels(_PARAMETERS)
+        # The 'best' location is re-picked on every draw, so it follows the bars
+        ax.legend(frameon=True, fancybox=True, shadow=True).set_animated(True)
         ax.grid(True, alpha=0.3, color=COLORS['border'])
+        # Animated bars are painted last anyway; keep full draws consistent
+        ax.set_axisbelow(True)
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.spines['left'].set_color(COLORS['border'])
         ax.spines['bottom'].set_color(COLORS['border'])
         ax.tick_params(colors=COLORS['text_secondary'])
         
-        figure.tight_layout()
-        self.variance_chart.canvas.draw()
+        card.ax = ax
         
-    def update_stats_table(self, statistical_summary):
-        """Update detailed statistics table"""
-        parameters = ['Flowrate', 'Pressure', 'Temperature']
-        self.stats_table.setRowCount(len(parameters))
+    def _on_chart_draw(self, card):
+        """Cache a chart's static background after a full draw, then paint the bars on it"""
+        if card.ax is None:
+            return
+        canvas = card.canvas
+        # The whole canvas, since value labels can rise above the axes
+        card._background = (canvas.copy_from_bbox(card.figure.bbox), canvas.get_width_height())
+        self._draw_bar_artists(card)
+        
+    def _draw_bar_artists(self, card):
+        """Draw a chart's animated bars, value labels and legend onto its renderer"""
+        ax = card.ax
+        for bars, texts in zip(card._bars, card._value_texts):
+            for artist in (*bars, *texts):
+                ax.draw_artist(artist)
+        ax.draw_artist(ax.get_legend())
+        
+    def _blit_chart(self, card):
+        """Repaint a chart from its cached background"""
+        canvas = card.canvas
+        if card._background is None or card._background[1] != canvas.get_width_height():
+            # Nothing cached at this size yet; the full draw caches it
+            canvas.draw_idle()
+            return
+        canvas.restore_region(card._background[0])
+        self._draw_bar_artists(card)
+        canvas.blit(card.figure.bbox)
         
-        for i, param in enumerate(parameters):
-            stats = statistical_summary.get(param, {})
-            
-            # Create styled table items
-            items = [
-                QTableWidgetItem(param),
-                QTableWidgetItem(f"{stats.get('count', 0):.0f}"),
-                QTableWidgetItem(f"{stats.get('mean', 0):.2f}"),
-                QTableWidgetItem(f"{stats.get('std', 0):.2f}"),
-                QTableWidgetItem(f"{stats.get('min', 0):.2f}"),
-                QTableWidgetItem(f"{stats.get('25%', 0):.2f}"),
-                QTableWidgetItem(f"{stats.get('50%', 0):.2f}"),
-                QTableWidgetItem(f"{stats.get('75%', 0):.2f}"),
-                QTableWidgetItem(f"{stats.get('max', 0):.2f}")
-            ]
-            
-            for j, item in enumerate(items):
-                if j == 0:  # Parameter name - make it bold
-                    item.setData(Qt.FontRole, 600)
-                item.setTextAlignment(Qt.AlignCenter)
-                self.stats_table.setItem(i, j, item)
-            
-        self.stats_table.resizeColumnsToContents()
\ No newline at end of file
+    def update_stats_table(self, stats_matrix):
+        """Update detailed statistics table from a _SUMMARY_KEYS column matrix"""
+        self.stats_model.set_rows(_PARAMETERS, stats_matrix)
\ No newline at end of file
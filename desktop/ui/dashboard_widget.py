@@ -3,6 +3,8 @@ Dashboard Widget - Professional card-based analytics dashboard
 Inspired by Material UI/Ant Design dashboard layouts
 """
 
+import logging
+
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
                              QLabel, QScrollArea, QFrame, QGridLayout, QPushButton)
 from PyQt5.QtCore import Qt, pyqtSignal
@@ -17,15 +19,111 @@ from .charts.insights_panel import InsightsPanel
 from .design_system import (COLORS, SPACING, DIMENSIONS, TAB_STYLE, 
                            get_section_title_style, get_body_text_style)
 
+log = logging.getLogger(__name__)
+
+# Widget stylesheets, formatted once at import
+_SECTION_TITLE_QSS = get_section_title_style()
+_BODY_QSS = get_body_text_style()
+
+_HEADER_FRAME_QSS = f"""
+QFrame {{
+    background-color: {COLORS['surface']};
+    border-bottom: 1px solid {COLORS['border']};
+    padding: {SPACING['lg']}px;
+}}
+"""
+
+_PDF_BUTTON_QSS = f"""
+QPushButton {{
+    background-color: {COLORS['success']};
+    color: white;
+    border: none;
+    padding: {SPACING['md']}px {SPACING['lg']}px;
+    border-radius: 6px;
+    font-size: 14px;
+    font-weight: 600;
+    min-width: 150px;
+}}
+QPushButton:hover {{
+    background-color: #45a049;
+}}
+QPushButton:pressed {{
+    background-color: #3d8b40;
+}}
+QPushButton:disabled {{
+    background-color: {COLORS['border']};
+    color: {COLORS['text_disabled']};
+}}
+"""
+
+# Shared by the six tab scroll areas
+_TAB_SCROLL_QSS = f"""
+QScrollArea {{
+    border: none;
+    background-color: {COLORS['background']};
+}}
+QScrollBar:vertical {{
+    background-color: {COLORS['surface_variant']};
+    width: 12px;
+    border-radius: 6px;
+}}
+QScrollBar::handle:vertical {{
+    background-color: {COLORS['border']};
+    border-radius: 6px;
+    min-height: 20px;
+}}
+QScrollBar::handle:vertical:hover {{
+    background-color: {COLORS['text_disabled']};
+}}
+"""
+
+_NO_DATA_FRAME_QSS = f"""
+QFrame {{
+    background-color: {COLORS['surface']};
+    border: 2px dashed {COLORS['border']};
+    border-radius: 12px;
+    margin: {SPACING['xxl']}px;
+}}
+"""
+
+_NO_DATA_TITLE_QSS = f"""
+QLabel {{
+    font-size: 20px;
+    font-weight: 600;
+    color: {COLORS['text_primary']};
+    margin: 0;
+}}
+"""
+
+_ERROR_QSS = f"""
+QLabel {{
+    font-size: 14px;
+    color: {COLORS['error']};
+    text-align: center;
+}}
+"""
+
 class DashboardWidget(QWidget):
     """Professional dashboard with card-based layout"""
     
     # Add signal for PDF generation
-    pdf_generation_requested = pyqtSignal()
+    pdf_generation_requested = pyqtSignal(object)  # Emitted with the analysis shown, or None
+    
+    # Analysis tabs in display order: (tab title, attribute name, chart widget class)
+    ANALYSIS_TABS = (
+        ("Overview", 'overview_charts', OverviewCharts),
+        ("Statistics", 'statistics_charts', StatisticsCharts),
+        ("Efficiency", 'efficiency_charts', EfficiencyCharts),
+        ("Correlations", 'correlation_charts', CorrelationCharts),
+        ("Outliers", 'outlier_charts', OutlierCharts),
+        ("Insights", 'insights_panel', InsightsPanel),
+    )
     
     def __init__(self):
         super().__init__()
         self.current_analysis = None
+        # Indexes of built tabs whose charts predate current_analysis
+        self._stale_tabs = set()
         
         self.init_ui()
         
@@ -47,13 +145,7 @@ class DashboardWidget(QWidget):
     def create_dashboard_header(self, layout):
         """Create clean dashboard header"""
         header_frame = QFrame()
-        header_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border-bottom: 1px solid {COLORS['border']};
-                padding: {SPACING['lg']}px;
-            }}
-        """)
+        header_frame.setStyleSheet(_HEADER_FRAME_QSS)
         
         header_layout = QHBoxLayout(header_frame)
         header_layout.setContentsMargins(0, 0, 0, 0)
@@ -65,39 +157,18 @@ class DashboardWidget(QWidget):
         
         # Title
         title_label = QLabel("Analysis Dashboard")
-        title_label.setStyleSheet(get_section_title_style())
+        title_label.setStyleSheet(_SECTION_TITLE_QSS)
         
         # Subtitle
         subtitle_label = QLabel("Comprehensive equipment parameter analysis and insights")
-        subtitle_label.setStyleSheet(get_body_text_style())
+        subtitle_label.setStyleSheet(_BODY_QSS)
         
         title_section.addWidget(title_label)
         title_section.addWidget(subtitle_label)
         
         # Right side - PDF generation button
         self.pdf_button = QPushButton("📄 Generate PDF Report")
-        self.pdf_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['success']};
-                color: white;
-                border: none;
-                padding: {SPACING['md']}px {SPACING['lg']}px;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: 600;
-                min-width: 150px;
-            }}
-            QPushButton:hover {{
-                background-color: #45a049;
-            }}
-            QPushButton:pressed {{
-                background-color: #3d8b40;
-            }}
-            QPushButton:disabled {{
-                background-color: {COLORS['border']};
-                color: {COLORS['text_disabled']};
-            }}
-        """)
+        self.pdf_button.setStyleSheet(_PDF_BUTTON_QSS)
         self.pdf_button.setEnabled(False)  # Initially disabled
         self.pdf_button.clicked.connect(self.generate_pdf_report)
         
@@ -112,66 +183,56 @@ class DashboardWidget(QWidget):
         self.tab_widget = QTabWidget()
         self.tab_widget.setStyleSheet(TAB_STYLE)
         
-        # Create chart widgets
-        self.overview_charts = OverviewCharts()
-        self.statistics_charts = StatisticsCharts()
-        self.efficiency_charts = EfficiencyCharts()
-        self.correlation_charts = CorrelationCharts()
-        self.outlier_charts = OutlierCharts()
-        self.insights_panel = InsightsPanel()
-        
-        # Add tabs with clean names
-        self.tab_widget.addTab(self.create_tab_content(self.overview_charts), "Overview")
-        self.tab_widget.addTab(self.create_tab_content(self.statistics_charts), "Statistics")
-        self.tab_widget.addTab(self.create_tab_content(self.efficiency_charts), "Efficiency")
-        self.tab_widget.addTab(self.create_tab_content(self.correlation_charts), "Correlations")
-        self.tab_widget.addTab(self.create_tab_content(self.outlier_charts), "Outliers")
-        self.tab_widget.addTab(self.create_tab_content(self.insights_panel), "Insights")
+        # Add tabs with clean names; each chart widget is only created the
+        # first time its tab is opened
+        for title, attribute, _ in self.ANALYSIS_TABS:
+            setattr(self, attribute, None)
+            self.tab_widget.addTab(self.create_tab_content(), title)
+        self.tab_widget.currentChanged.connect(self._prepare_tab)
+        self._prepare_tab(self.tab_widget.currentIndex())
         
         layout.addWidget(self.tab_widget)
         
         # Initially hidden
         self.tab_widget.setVisible(False)
         
-    def create_tab_content(self, widget):
-        """Create scrollable tab content with proper spacing"""
+    def create_tab_content(self):
+        """Create scrollable tab content with proper spacing; the chart widget is set later"""
         scroll_area = QScrollArea()
-        scroll_area.setWidget(widget)
         scroll_area.setWidgetResizable(True)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background-color: {COLORS['background']};
-            }}
-            QScrollBar:vertical {{
-                background-color: {COLORS['surface_variant']};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {COLORS['border']};
-                border-radius: 6px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {COLORS['text_disabled']};
-            }}
-        """)
+        scroll_area.setStyleSheet(_TAB_SCROLL_QSS)
         return scroll_area
         
+    def _prepare_tab(self, index):
+        """Create the chart widget of the tab at index if needed and bring it up to date"""
+        if index < 0:
+            return
+        # Also runs from the currentChanged slot, outside update_analysis
+        try:
+            _, attribute, widget_class = self.ANALYSIS_TABS[index]
+            widget = getattr(self, attribute)
+            if widget is None:
+                widget = widget_class()
+                setattr(self, attribute, widget)
+                self.tab_widget.widget(index).setWidget(widget)
+            elif index not in self._stale_tabs:
+                return
+            
+            # Catch up with results that arrived while the tab was not shown
+            if self.current_analysis and 'analysis_results' in self.current_analysis:
+                widget.update_data(self.current_analysis['analysis_results'])
+            self._stale_tabs.discard(index)
+            
+        except Exception as e:
+            log.exception("Dashboard tab update failed")
+            self.show_error(f"Error displaying analysis: {str(e)}")
+        
     def create_no_data_state(self, layout):
         """Create professional no data state"""
         self.no_data_frame = QFrame()
-        self.no_data_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border: 2px dashed {COLORS['border']};
-                border-radius: 12px;
-                margin: {SPACING['xxl']}px;
-            }}
-        """)
+        self.no_data_frame.setStyleSheet(_NO_DATA_FRAME_QSS)
         
         no_data_layout = QVBoxLayout(self.no_data_frame)
         no_data_layout.setAlignment(Qt.AlignCenter)
@@ -185,19 +246,12 @@ class DashboardWidget(QWidget):
         # Title
         title_label = QLabel("No Analysis Data")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 20px;
-                font-weight: 600;
-                color: {COLORS['text_primary']};
-                margin: 0;
-            }}
-        """)
+        title_label.setStyleSheet(_NO_DATA_TITLE_QSS)
         
         # Description
         self.desc_label = QLabel("Upload a CSV file to begin comprehensive equipment analysis")
         self.desc_label.setAlignment(Qt.AlignCenter)
-        self.desc_label.setStyleSheet(get_body_text_style())
+        self.desc_label.setStyleSheet(_BODY_QSS)
         self.desc_label.setWordWrap(True)
         
         no_data_layout.addWidget(icon_label)
@@ -208,45 +262,49 @@ class DashboardWidget(QWidget):
         
     def update_analysis(self, analysis_data):
         """Update dashboard with new analysis data"""
+        # The same results object passed again needs no chart refresh
+        refresh = analysis_data is not self.current_analysis
         self.current_analysis = analysis_data
         
         if not analysis_data or 'analysis_results' not in analysis_data:
             self.show_no_data()
             return
             
-        # Hide no data and show analysis
-        self.no_data_frame.setVisible(False)
-        self.tab_widget.setVisible(True)
-        
-        # Enable PDF generation button
-        self.pdf_button.setEnabled(True)
-        
-        # Update all chart widgets
-        analysis_results = analysis_data['analysis_results']
-        
+        # Repaint the dashboard once, after the update; this also
+        # covers the chart widgets, as disabling updates applies to children
+        self.setUpdatesEnabled(False)
         try:
-            print("DEBUG: Updating dashboard components...")
+            # Hide no data and show analysis
+            self.no_data_frame.setVisible(False)
+            self.tab_widget.setVisible(True)
             
-            self.overview_charts.update_data(analysis_results)
-            self.statistics_charts.update_data(analysis_results)
-            self.efficiency_charts.update_data(analysis_results)
-            self.correlation_charts.update_data(analysis_results)
-            self.outlier_charts.update_data(analysis_results)
-            self.insights_panel.update_data(analysis_results)
+            # Enable PDF generation button
+            self.pdf_button.setEnabled(True)
             
-            # Switch to overview tab
+            log.debug("Updating dashboard components")
+            
+            # Hidden tabs would still redraw their figures, so built tabs are
+            # only marked stale here and refreshed as they are shown
+            if refresh:
+                self._stale_tabs.update(index for index, (_, attribute, _)
+                                        in enumerate(self.ANALYSIS_TABS)
+                                        if getattr(self, attribute) is not None)
+            
+            # Switch to overview tab, refreshing it first so errors land here
+            self._prepare_tab(0)
             self.tab_widget.setCurrentIndex(0)
-            print("DEBUG: Dashboard update completed successfully")
+            log.debug("Dashboard update completed successfully")
             
         except Exception as e:
-            print(f"ERROR: Dashboard update failed: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Dashboard update failed")
             self.show_error(f"Error displaying analysis: {str(e)}")
             
+        finally:
+            self.setUpdatesEnabled(True)
+            
     def generate_pdf_report(self):
         """Generate PDF report - emit signal to main window"""
-        self.pdf_generation_requested.emit()
+        self.pdf_generation_requested.emit(self.current_analysis)
             
     def show_no_data(self):
         """Show no data state"""
@@ -258,7 +316,7 @@ class DashboardWidget(QWidget):
         
         # Reset description
         self.desc_label.setText("Upload a CSV file to begin comprehensive equipment analysis")
-        self.desc_label.setStyleSheet(get_body_text_style())
+        self.desc_label.setStyleSheet(_BODY_QSS)
         
     def show_error(self, message):
         """Show error state"""
@@ -267,13 +325,7 @@ class DashboardWidget(QWidget):
         
         # Update description to show error
         self.desc_label.setText(f"Error: {message}")
-        self.desc_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 14px;
-                color: {COLORS['error']};
-                text-align: center;
-            }}
-        """)
+        self.desc_label.setStyleSheet(_ERROR_QSS)
         
     def clear_data(self):
         """Clear all dashboard data"""
@@ -74,6 +74,7 @@ DIMENSIONS = {
     'chart_aspect_ratio': 1.6,  # 16:10
     'chart_min_width': 400,
     'chart_min_height': 250,
+    'chart_dpi': 100,  # Scales chart text/lines; Qt canvases size the raster from widget pixels
     'container_max_width': 1200,
     'sidebar_width': 280
 }
@@ -143,46 +144,60 @@ QTabBar::tab:hover:!selected {{
 }}
 """
 
+# Label Styling (formatted once at import and returned by the getters below)
+_SECTION_TITLE_STYLE = f"""
+QLabel {{
+    font-size: {TYPOGRAPHY['section_title']['size']}px;
+    font-weight: {TYPOGRAPHY['section_title']['weight']};
+    color: {TYPOGRAPHY['section_title']['color']};
+    margin-bottom: {SPACING['sm']}px;
+    padding: 0;
+}}
+"""
+
+_CARD_TITLE_STYLE = f"""
+QLabel {{
+    font-size: {TYPOGRAPHY['card_title']['size']}px;
+    font-weight: {TYPOGRAPHY['card_title']['weight']};
+    color: {TYPOGRAPHY['card_title']['color']};
+    margin-bottom: {SPACING['md']}px;
+    padding: 0;
+}}
+"""
+
+_BODY_TEXT_STYLE = f"""
+QLabel {{
+    font-size: {TYPOGRAPHY['body']['size']}px;
+    color: {TYPOGRAPHY['body']['color']};
+    line-height: 1.5;
+}}
+"""
+
+_CAPTION_STYLE = f"""
+QLabel {{
+    font-size: {TYPOGRAPHY['caption']['size']}px;
+    color: {TYPOGRAPHY['caption']['color']};
+    font-style: italic;
+}}
+"""
+
 def get_section_title_style():
     """Get section title styling"""
-    return f"""
-    QLabel {{
-        font-size: {TYPOGRAPHY['section_title']['size']}px;
-        font-weight: {TYPOGRAPHY['section_title']['weight']};
-        color: {TYPOGRAPHY['section_title']['color']};
-        margin-bottom: {SPACING['sm']}px;
-        padding: 0;
-    }}
-    """
+    return _SECTION_TITLE_STYLE
 
 def get_card_title_style():
     """Get card title styling"""
-    return f"""
-    QLabel {{
-        font-size: {TYPOGRAPHY['card_title']['size']}px;
-        font-weight: {TYPOGRAPHY['card_title']['weight']};
-        color: {TYPOGRAPHY['card_title']['color']};
-        margin-bottom: {SPACING['md']}px;
-        padding: 0;
-    }}
-    """
+    return _CARD_TITLE_STYLE
 
 def get_body_text_style():
     """Get body text styling"""
-    return f"""
-    QLabel {{
-        font-size: {TYPOGRAPHY['body']['size']}px;
-        color: {TYPOGRAPHY['body']['color']};
-        line-height: 1.5;
-    }}
-    """
+    return _BODY_TEXT_STYLE
 
 def get_caption_style():
     """Get caption text styling"""
-    return f"""
-    QLabel {{
-        font-size: {TYPOGRAPHY['caption']['size']}px;
-        color: {TYPOGRAPHY['caption']['color']};
-        font-style: italic;
-    }}
-    """
\ No newline at end of file
+    return _CAPTION_STYLE
+
+def scoped_style(selectors, qss):
+    """Re-target a single-rule QSS block at the given selectors"""
+    block = qss.strip()
+    return f"{selectors} {block[block.index('{'):]}"
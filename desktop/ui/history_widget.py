@@ -4,11 +4,164 @@ History Widget - Dataset upload history and management
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QTableWidget, QTableWidgetItem, QPushButton,
-                             QFrame, QMessageBox, QHeaderView, QAbstractItemView)
-from PyQt5.QtCore import Qt, pyqtSignal, QThread, pyqtSlot
-from PyQt5.QtGui import QFont
+                             QFrame, QMessageBox, QHeaderView, QAbstractItemView,
+                             QProgressDialog, QFileDialog)
+from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTimer, pyqtSlot
+from PyQt5.QtGui import QFont, QBrush
 from datetime import datetime
+from difflib import SequenceMatcher
+from functools import lru_cache
 import json
+import os
+import platform
+import re
+import subprocess
+
+# One stylesheet for the whole widget; widgets are matched by object name.
+# The table frame rule also matches descendant QFrames (the table and its
+# header included) to keep the cascade its own "QFrame { ... }" sheet used to
+# produce; the table rules come after it so they win on equal specificity.
+_HISTORY_QSS = """
+QLabel#historyTitle {
+    color: #333;
+    margin-bottom: 10px;
+}
+QLabel#statusLabel {
+    color: #666;
+    font-style: italic;
+}
+QPushButton#refreshButton {
+    background-color: #667eea;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 5px;
+    font-weight: bold;
+}
+QPushButton#refreshButton:hover {
+    background-color: #5a6fd8;
+}
+QPushButton#refreshButton:pressed {
+    background-color: #4c63d2;
+}
+QFrame#tableFrame, #tableFrame QFrame {
+    background-color: white;
+    border: 1px solid #ddd;
+    border-radius: 10px;
+    padding: 15px;
+}
+QTableWidget#historyTable {
+    gridline-color: #ddd;
+    background-color: white;
+    alternate-background-color: #f8f9fa;
+    selection-background-color: #e3f2fd;
+}
+QTableWidget#historyTable::item {
+    padding: 8px;
+    border-bottom: 1px solid #eee;
+}
+#historyTable QHeaderView::section {
+    background-color: #f8f9fa;
+    padding: 10px;
+    border: 1px solid #ddd;
+    font-weight: bold;
+}
+QPushButton#viewButton, QPushButton#deleteButton, QPushButton#exportButton {
+    color: white;
+    border: none;
+    padding: 10px 20px;
+    border-radius: 5px;
+    font-weight: bold;
+}
+QPushButton#viewButton {
+    background-color: #28a745;
+}
+QPushButton#viewButton:hover {
+    background-color: #218838;
+}
+QPushButton#viewButton:pressed {
+    background-color: #1e7e34;
+}
+QPushButton#deleteButton {
+    background-color: #dc3545;
+}
+QPushButton#deleteButton:hover {
+    background-color: #c82333;
+}
+QPushButton#deleteButton:pressed {
+    background-color: #bd2130;
+}
+QPushButton#exportButton {
+    background-color: #17a2b8;
+}
+QPushButton#exportButton:hover {
+    background-color: #138496;
+}
+QPushButton#exportButton:pressed {
+    background-color: #117a8b;
+}
+QPushButton#viewButton:disabled, QPushButton#deleteButton:disabled,
+QPushButton#exportButton:disabled {
+    background-color: #6c757d;
+}
+"""
+
+# Status cell backgrounds, and centered cell templates cloned for each row
+_ANALYZED_BRUSH = QBrush(Qt.green)
+_UPLOADED_BRUSH = QBrush(Qt.yellow)
+
+_CENTERED_ITEM = QTableWidgetItem()
+_CENTERED_ITEM.setTextAlignment(Qt.AlignCenter)
+
+_ACTIONS_ITEM = _CENTERED_ITEM.clone()
+_ACTIONS_ITEM.setText("Select row for actions")
+
+# ISO timestamps as the backend sends them, with in-range date and time fields;
+# the groups are the day and the "YYYY-MM-DD", "HH:MM" display parts
+_ISO_TIMESTAMP = re.compile(r'(\d{4}-(?:0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01]))'
+                            r'T((?:[01]\d|2[0-3]):[0-5]\d)'
+                            r'(?::[0-5]\d(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:\d{2})?')
+
+@lru_cache(maxsize=4096)
+def _format_upload_date(upload_date):
+    """Format an ISO upload timestamp string for the history table
+    
+    Cached, as a refresh mostly lists the same datasets again.
+    """
+    try:
+        # Backend timestamps only need the "T" replaced and seconds/offset dropped;
+        # days past the 28th are left to fromisoformat to check against the month
+        match = _ISO_TIMESTAMP.fullmatch(upload_date)
+        if match and match.group(2) <= '28':
+            return f"{match.group(1)} {match.group(3)}"
+        date_obj = datetime.fromisoformat(upload_date.replace('Z', '+00:00'))
+        return date_obj.strftime('%Y-%m-%d %H:%M')
+    except ValueError:
+        # Unparseable: shown as is
+        return upload_date
+
+def _has_analysis(dataset):
+    """Whether a history entry has analysis results
+    
+    History entries only carry the summary metrics; the full results are
+    fetched on demand and then kept on the entry.
+    """
+    return bool(dataset.get('analysis_results') or dataset.get('summary_stats'))
+
+def _history_row(dataset):
+    """Display texts of a dataset's history table row: name, date, count and status"""
+    upload_date = dataset.get('upload_date', '')
+    if not upload_date:
+        upload_date = 'Unknown'
+    elif isinstance(upload_date, str):
+        upload_date = _format_upload_date(upload_date)
+    else:
+        # Not a timestamp string, and possibly unhashable for the cache: shown as is
+        upload_date = str(upload_date)
+    return (dataset.get('filename', 'Unknown'),
+            upload_date,
+            str(dataset.get('equipment_count', 0)),
+            "Analyzed" if _has_analysis(dataset) else "Uploaded")
 
 class HistoryLoadThread(QThread):
     """Thread for loading history data"""
@@ -32,16 +185,32 @@ class HistoryWidget(QWidget):
     
     dataset_selected = pyqtSignal(dict)  # Emitted when user selects a dataset
     
+    # Quiet period before a burst of selection changes updates the buttons
+    SELECTION_DELAY_MS = 30
+    
     def __init__(self, api_client):
         super().__init__()
         self.api_client = api_client
         self.history_data = []
-        self.load_thread = None
+        # _history_row texts of the rows the table currently shows
+        self._table_rows = []
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(self.SELECTION_DELAY_MS)
+        self._selection_timer.timeout.connect(self.on_selection_changed)
         
         self.init_ui()
         
+        # One loader, restarted for each refresh
+        self.load_thread = HistoryLoadThread(self.api_client)
+        self.load_thread.history_loaded.connect(self.on_history_loaded)
+        self.load_thread.error_occurred.connect(self.on_history_error)
+        
     def init_ui(self):
         """Initialize history widget UI"""
+        # Child widgets are styled by object name from this one sheet
+        self.setStyleSheet(_HISTORY_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
         
@@ -56,7 +225,7 @@ class HistoryWidget(QWidget):
         
         # Status label
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("color: #666; font-style: italic;")
+        self.status_label.setObjectName("statusLabel")
         layout.addWidget(self.status_label)
         
     def create_header(self, layout):
@@ -69,26 +238,11 @@ class HistoryWidget(QWidget):
         title_font.setPointSize(16)
         title_font.setBold(True)
         title_label.setFont(title_font)
-        title_label.setStyleSheet("color: #333; margin-bottom: 10px;")
+        title_label.setObjectName("historyTitle")
         
         # Refresh button
         self.refresh_button = QPushButton("Refresh")
-        self.refresh_button.setStyleSheet("""
-            QPushButton {
-                background-color: #667eea;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a6fd8;
-            }
-            QPushButton:pressed {
-                background-color: #4c63d2;
-            }
-        """)
+        self.refresh_button.setObjectName("refreshButton")
         self.refresh_button.clicked.connect(self.refresh_history)
         
         header_layout.addWidget(title_label)
@@ -100,57 +254,34 @@ class HistoryWidget(QWidget):
     def create_history_table(self, layout):
         """Create history table"""
         table_frame = QFrame()
-        table_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        table_frame.setObjectName("tableFrame")
         
         table_layout = QVBoxLayout(table_frame)
         
         # Table widget
         self.history_table = QTableWidget()
+        self.history_table.setObjectName("historyTable")
         self.history_table.setColumnCount(5)
         self.history_table.setHorizontalHeaderLabels([
             "Dataset Name", "Upload Date", "Equipment Count", "Status", "Actions"
         ])
         
-        # Table styling
-        self.history_table.setStyleSheet("""
-            QTableWidget {
-                gridline-color: #ddd;
-                background-color: white;
-                alternate-background-color: #f8f9fa;
-                selection-background-color: #e3f2fd;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #eee;
-            }
-            QHeaderView::section {
-                background-color: #f8f9fa;
-                padding: 10px;
-                border: 1px solid #ddd;
-                font-weight: bold;
-            }
-        """)
-        
         # Table properties
         self.history_table.setAlternatingRowColors(True)
         self.history_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.history_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.history_table.verticalHeader().setVisible(False)
         
-        # Resize columns
+        # Resize columns; the rest are fitted to their contents by
+        # fit_history_columns, only when rows change, rather than measured
+        # by the header on every layout (ResizeToContents)
         header = self.history_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)  # Dataset Name
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)  # Upload Date
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # Equipment Count
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # Status
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Actions
+        header.setSectionResizeMode(1, QHeaderView.Interactive)  # Upload Date
+        header.setSectionResizeMode(2, QHeaderView.Interactive)  # Equipment Count
+        header.setSectionResizeMode(3, QHeaderView.Interactive)  # Status
+        header.setSectionResizeMode(4, QHeaderView.Interactive)  # Actions
+        self.fit_history_columns()
         
         table_layout.addWidget(self.history_table)
         layout.addWidget(table_frame)
@@ -161,73 +292,19 @@ class HistoryWidget(QWidget):
         
         # View Analysis button
         self.view_button = QPushButton("View Analysis")
-        self.view_button.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:pressed {
-                background-color: #1e7e34;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-            }
-        """)
+        self.view_button.setObjectName("viewButton")
         self.view_button.clicked.connect(self.view_selected_analysis)
         self.view_button.setEnabled(False)
         
         # Delete Dataset button
         self.delete_button = QPushButton("Delete Dataset")
-        self.delete_button.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-            QPushButton:pressed {
-                background-color: #bd2130;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-            }
-        """)
+        self.delete_button.setObjectName("deleteButton")
         self.delete_button.clicked.connect(self.delete_selected_dataset)
         self.delete_button.setEnabled(False)
         
         # Export Report button
         self.export_button = QPushButton("Export Report")
-        self.export_button.setStyleSheet("""
-            QPushButton {
-                background-color: #17a2b8;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #138496;
-            }
-            QPushButton:pressed {
-                background-color: #117a8b;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-            }
-        """)
+        self.export_button.setObjectName("exportButton")
         self.export_button.clicked.connect(self.export_selected_report)
         self.export_button.setEnabled(False)
         
@@ -238,21 +315,20 @@ class HistoryWidget(QWidget):
         
         layout.addLayout(button_layout)
         
-        # Connect table selection
-        self.history_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        # Connect table selection; a burst of changes, such as arrowing
+        # through rows, updates the buttons once
+        self.history_table.selectionModel().selectionChanged.connect(
+            lambda selected, deselected: self._selection_timer.start())
         
     def refresh_history(self):
         """Refresh history data"""
-        if self.load_thread and self.load_thread.isRunning():
+        if self.load_thread.isRunning():
             return
             
         self.status_label.setText("Loading history...")
         self.refresh_button.setEnabled(False)
         
         # Start loading thread
-        self.load_thread = HistoryLoadThread(self.api_client)
-        self.load_thread.history_loaded.connect(self.on_history_loaded)
-        self.load_thread.error_occurred.connect(self.on_history_error)
         self.load_thread.start()
         
     @pyqtSlot(list)
@@ -271,89 +347,130 @@ class HistoryWidget(QWidget):
         QMessageBox.warning(self, "Error", f"Failed to load history: {error_message}")
         
     def populate_history_table(self):
-        """Populate history table with data"""
-        self.history_table.setRowCount(len(self.history_data))
-        
-        for row, dataset in enumerate(self.history_data):
-            # Dataset name
-            name_item = QTableWidgetItem(dataset.get('filename', 'Unknown'))
-            self.history_table.setItem(row, 0, name_item)
-            
-            # Upload date
-            upload_date = dataset.get('upload_date', '')
-            if upload_date:
-                try:
-                    # Parse and format date
-                    date_obj = datetime.fromisoformat(upload_date.replace('Z', '+00:00'))
-                    formatted_date = date_obj.strftime('%Y-%m-%d %H:%M')
-                except:
-                    formatted_date = upload_date
-            else:
-                formatted_date = 'Unknown'
-            date_item = QTableWidgetItem(formatted_date)
-            self.history_table.setItem(row, 1, date_item)
-            
-            # Equipment count
-            equipment_count = dataset.get('equipment_count', 0)
-            count_item = QTableWidgetItem(str(equipment_count))
-            count_item.setTextAlignment(Qt.AlignCenter)
-            self.history_table.setItem(row, 2, count_item)
-            
-            # Status
-            status = "Analyzed" if dataset.get('analysis_results') else "Uploaded"
-            status_item = QTableWidgetItem(status)
-            status_item.setTextAlignment(Qt.AlignCenter)
-            if status == "Analyzed":
-                status_item.setBackground(Qt.green)
-            else:
-                status_item.setBackground(Qt.yellow)
-            self.history_table.setItem(row, 3, status_item)
-            
-            # Actions (placeholder)
-            actions_item = QTableWidgetItem("Select row for actions")
-            actions_item.setTextAlignment(Qt.AlignCenter)
-            self.history_table.setItem(row, 4, actions_item)
+        """Populate history table with data
+        
+        The new rows are diffed against the ones shown, so a refresh only
+        touches rows that were added, removed or changed.
+        """
+        rows = [_history_row(dataset) for dataset in self.history_data]
+        matcher = SequenceMatcher(None, self._table_rows, rows, autojunk=False)
+        
+        # Rows no longer match history_data mid-edit, so selection changes
+        # are only acted on once the table is up to date; the table is
+        # repainted once, after the edit
+        selection_model = self.history_table.selectionModel()
+        selection_model.blockSignals(True)
+        self.history_table.setUpdatesEnabled(False)
+        try:
+            # Edit from the bottom up so rows above each edit keep their index
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag == 'equal':
+                    continue
+                shown, new = i2 - i1, j2 - j1
+                for k in range(min(shown, new)):
+                    self.set_history_row(i1 + k, rows[j1 + k])
+                for _ in range(new, shown):
+                    self.history_table.removeRow(i1 + new)
+                for k in range(shown, new):
+                    self.history_table.insertRow(i1 + k)
+                    self.set_history_row(i1 + k, rows[j1 + k])
+            if rows != self._table_rows:
+                self.fit_history_columns()
+        finally:
+            self.history_table.setUpdatesEnabled(True)
+            selection_model.blockSignals(False)
+        
+        self._table_rows = rows
+        self.on_selection_changed()
+        
+    def fit_history_columns(self):
+        """Size the date, count, status and actions columns to their contents"""
+        for column in range(1, self.history_table.columnCount()):
+            self.history_table.resizeColumnToContents(column)
+        
+    def set_history_row(self, row, cells):
+        """Fill a history table row with _history_row display texts"""
+        name, formatted_date, equipment_count, status = cells
+        
+        # Dataset name
+        name_item = QTableWidgetItem(name)
+        self.history_table.setItem(row, 0, name_item)
+        
+        # Upload date
+        date_item = QTableWidgetItem(formatted_date)
+        self.history_table.setItem(row, 1, date_item)
+        
+        # Equipment count
+        count_item = _CENTERED_ITEM.clone()
+        count_item.setText(equipment_count)
+        self.history_table.setItem(row, 2, count_item)
+        
+        # Status
+        status_item = _CENTERED_ITEM.clone()
+        status_item.setText(status)
+        status_item.setBackground(_ANALYZED_BRUSH if status == "Analyzed" else _UPLOADED_BRUSH)
+        self.history_table.setItem(row, 3, status_item)
+        
+        # Actions (placeholder)
+        self.history_table.setItem(row, 4, _ACTIONS_ITEM.clone())
             
+    def selected_row(self):
+        """Index of the selected history row, or None when nothing is selected"""
+        selected_rows = self.history_table.selectionModel().selectedRows()
+        return selected_rows[0].row() if selected_rows else None
+        
     def on_selection_changed(self):
         """Handle table selection change"""
-        selected_rows = self.history_table.selectionModel().selectedRows()
-        has_selection = len(selected_rows) > 0
+        row = self.selected_row()
+        has_selection = row is not None
+        # View and export also need analysis results; each button is set once
+        has_analysis = has_selection and _has_analysis(self.history_data[row])
         
-        self.view_button.setEnabled(has_selection)
+        self.view_button.setEnabled(has_analysis)
         self.delete_button.setEnabled(has_selection)
-        self.export_button.setEnabled(has_selection)
-        
-        if has_selection:
-            row = selected_rows[0].row()
-            dataset = self.history_data[row]
-            has_analysis = bool(dataset.get('analysis_results'))
-            self.view_button.setEnabled(has_analysis)
-            self.export_button.setEnabled(has_analysis)
+        self.export_button.setEnabled(has_analysis)
             
     def view_selected_analysis(self):
         """View analysis for selected dataset"""
-        selected_rows = self.history_table.selectionModel().selectedRows()
-        if not selected_rows:
+        row = self.selected_row()
+        if row is None:
             return
             
-        row = selected_rows[0].row()
         dataset = self.history_data[row]
         
-        if not dataset.get('analysis_results'):
+        if not _has_analysis(dataset):
             QMessageBox.information(self, "No Analysis", 
                                   "This dataset has not been analyzed yet.")
             return
+        
+        try:
+            dataset = self.load_dataset_details(row)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error loading analysis: {str(e)}")
+            return
             
         # Emit signal with dataset data
         self.dataset_selected.emit(dataset)
         
+    def load_dataset_details(self, row):
+        """Return the history entry at row with its full analysis results
+        
+        The results are fetched the first time they are needed and kept on
+        the entry for later views and exports.
+        """
+        dataset = self.history_data[row]
+        if not dataset.get('analysis_results') and dataset.get('id'):
+            details = self.api_client.get_dataset(dataset['id'])
+            dataset = {**dataset, **details}
+            self.history_data[row] = dataset
+        return dataset
+        
     def delete_selected_dataset(self):
         """Delete selected dataset"""
-        selected_rows = self.history_table.selectionModel().selectedRows()
-        if not selected_rows:
+        row = self.selected_row()
+        if row is None:
             return
             
-        row = selected_rows[0].row()
         dataset = self.history_data[row]
         dataset_name = dataset.get('filename', 'Unknown')
         
@@ -380,47 +497,19 @@ class HistoryWidget(QWidget):
                 
     def export_selected_report(self):
         """Export PDF report for selected dataset"""
-        selected_rows = self.history_table.selectionModel().selectedRows()
-        if not selected_rows:
+        row = self.selected_row()
+        if row is None:
             return
             
-        row = selected_rows[0].row()
         dataset = self.history_data[row]
         
-        if not dataset.get('analysis_results'):
+        if not _has_analysis(dataset):
             QMessageBox.information(self, "No Analysis", 
                                   "This dataset has not been analyzed yet.")
             return
         
         try:
-            # Show progress dialog
-            from PyQt5.QtWidgets import QProgressDialog
-            from PyQt5.QtCore import QTimer
-            
-            progress = QProgressDialog("Generating PDF report...", "Cancel", 0, 0, self)
-            progress.setWindowTitle("PDF Generation")
-            progress.setModal(True)
-            progress.show()
-            
-            # Generate PDF using dataset ID
-            dataset_id = dataset.get('id')
-            if dataset_id:
-                pdf_content = self.api_client.generate_pdf_from_dataset(dataset_id)
-            else:
-                # Fallback to using analysis results directly
-                analysis_results = dataset.get('analysis_results', {})
-                dataset_info = {
-                    'filename': dataset.get('filename', 'equipment_data.csv'),
-                    'upload_date': dataset.get('upload_date', ''),
-                    'equipment_count': dataset.get('equipment_count', 0)
-                }
-                pdf_content = self.api_client.generate_pdf_report(analysis_results, dataset_info)
-            
-            # Save PDF file
-            from PyQt5.QtWidgets import QFileDialog
-            import os
-            from datetime import datetime
-            
+            # Choose the target first, so the report can be written as it arrives
             dataset_name = dataset.get('filename', 'equipment_data').replace('.csv', '')
             default_filename = f"{dataset_name}_analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
             
@@ -431,11 +520,38 @@ class HistoryWidget(QWidget):
                 "PDF Files (*.pdf);;All Files (*)"
             )
             
-            progress.close()
-            
             if file_path:
-                with open(file_path, 'wb') as f:
-                    f.write(pdf_content)
+                # Show progress dialog
+                progress = QProgressDialog("Generating PDF report...", "Cancel", 0, 0, self)
+                progress.setWindowTitle("PDF Generation")
+                progress.setModal(True)
+                progress.show()
+                
+                # Generate PDF using dataset ID
+                dataset_id = dataset.get('id')
+                if dataset_id:
+                    # Streamed to disk in chunks rather than held in memory whole
+                    try:
+                        with open(file_path, 'wb') as f:
+                            self.api_client.stream_pdf_from_dataset(dataset_id, f)
+                    except Exception:
+                        # Don't leave a truncated report behind
+                        if os.path.exists(file_path):
+                            os.remove(file_path)
+                        raise
+                else:
+                    # Fallback to using analysis results directly
+                    analysis_results = dataset.get('analysis_results', {})
+                    dataset_info = {
+                        'filename': dataset.get('filename', 'equipment_data.csv'),
+                        'upload_date': dataset.get('upload_date', ''),
+                        'equipment_count': dataset.get('equipment_count', 0)
+                    }
+                    pdf_content = self.api_client.generate_pdf_report(analysis_results, dataset_info)
+                    with open(file_path, 'wb') as f:
+                        f.write(pdf_content)
+                
+                progress.close()
                 
                 QMessageBox.information(self, "Success", f"PDF report saved successfully to:\n{file_path}")
                 
@@ -449,9 +565,6 @@ class HistoryWidget(QWidget):
                 )
                 
                 if reply == QMessageBox.Yes:
-                    import subprocess
-                    import platform
-                    
                     if platform.system() == 'Windows':
                         os.startfile(file_path)
                     elif platform.system() == 'Darwin':  # macOS
@@ -233,7 +233,7 @@ class MainWindow(QMainWindow):
         self.history_widget.dataset_selected.connect(self.on_dataset_selected)
         
         # Dashboard widget signals
-        self.dashboard_widget.pdf_generation_requested.connect(self.generate_pdf_report)
+        self.dashboard_widget.pdf_generation_requested.connect(self.export_pdf_report)
         
     def check_authentication(self):
         """Check if user is already authenticated"""
@@ -314,8 +314,12 @@ class MainWindow(QMainWindow):
         self.pdf_action.setEnabled(True)
         
     def generate_pdf_report(self):
-        """Generate and save PDF report"""
-        if not self.current_analysis:
+        """Generate and save PDF report for the current analysis"""
+        self.export_pdf_report(self.current_analysis)
+        
+    def export_pdf_report(self, analysis_data):
+        """Generate and save a PDF report for analysis_data"""
+        if not analysis_data:
             self.show_styled_message("No Data", "No analysis data available for PDF generation.", "warning")
             return
             
@@ -334,10 +338,10 @@ class MainWindow(QMainWindow):
             progress.show()
             
             # Get analysis results
-            analysis_results = self.current_analysis.get('analysis_results', {})
+            analysis_results = analysis_data.get('analysis_results', {})
             dataset_info = {
                 'filename': 'equipment_data.csv',  # You can enhance this to get actual filename
-                'upload_date': self.current_analysis.get('upload_date', ''),
+                'upload_date': analysis_data.get('upload_date', ''),
                 'equipment_count': analysis_results.get('summary_metrics', {}).get('dataset_overview', {}).get('total_equipment_count', 0)
             }
             